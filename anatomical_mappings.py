@@ -3,6 +3,15 @@ Anatomical Structure Mappings
 Maps specific bones, muscles, ligaments, and other structures to body regions
 """
 
+import re
+
+# Optional multi-pattern matcher for scanning reports for all terms at once
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 # Comprehensive mapping of anatomical structures to region IDs
 ANATOMICAL_MAPPINGS = {
     # Head & Skull
@@ -229,6 +238,60 @@ LATERALITY_LEFT = ["left", "lt", "lft", "sinister"]
 LATERALITY_RIGHT = ["right", "rt", "rgt", "dextra"]
 LATERALITY_BILATERAL = ["bilateral", "bilat", "b/l", "both"]
 
+# One scan finds every laterality term; the zero-width lookahead reports
+# terms that overlap (e.g. "b/lt" holds both "b/l" and "lt")
+_LATERALITY_GROUPS = {
+    **{term: "left" for term in LATERALITY_LEFT},
+    **{term: "right" for term in LATERALITY_RIGHT},
+    **{term: "bilateral" for term in LATERALITY_BILATERAL},
+}
+_LATERALITY_RE = re.compile(
+    "(?=(" + "|".join(re.escape(term) for term in _LATERALITY_GROUPS) + "))"
+)
+
+
+def _laterality_flags(text_lower: str) -> tuple:
+    """Return (has_left, has_right, has_bilateral) from one scan of text_lower."""
+    found = {_LATERALITY_GROUPS[term] for term in _LATERALITY_RE.findall(text_lower)}
+    return "left" in found, "right" in found, "bilateral" in found
+
+
+def _build_term_automaton():
+    """Build an Aho-Corasick automaton over ANATOMICAL_MAPPINGS keys (None without pyahocorasick)."""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for term in ANATOMICAL_MAPPINGS:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+    return automaton
+
+
+_TERM_AUTOMATON = _build_term_automaton()
+
+
+def _find_anatomical_terms(text_lower: str) -> dict:
+    """
+    Map each anatomical term found in text_lower to its first index.
+
+    With pyahocorasick the text is scanned once for all terms; otherwise
+    each term is searched for in turn.
+    """
+    if _TERM_AUTOMATON is None:
+        found = {}
+        for term in ANATOMICAL_MAPPINGS:
+            term_index = text_lower.find(term)
+            if term_index != -1:
+                found[term] = term_index
+        return found
+
+    found = {}
+    # Matches arrive in order of end index, so the first hit per term is its first occurrence
+    for end_index, term in _TERM_AUTOMATON.iter(text_lower):
+        if term not in found:
+            found[term] = end_index - len(term) + 1
+    return found
+
 
 def map_anatomical_term_to_regions(term: str, context: str = "") -> list:
     """
@@ -250,20 +313,13 @@ def map_anatomical_term_to_regions(term: str, context: str = "") -> list:
         term_pos = context_lower.find(term)
         if term_pos == -1:
             # Term not in context, check full context (fallback)
-            has_left = any(lat in context_lower for lat in LATERALITY_LEFT)
-            has_right = any(lat in context_lower for lat in LATERALITY_RIGHT)
-            has_bilateral = any(lat in context_lower for lat in LATERALITY_BILATERAL)
-            return has_left, has_right, has_bilateral
+            return _laterality_flags(context_lower)
 
         # Check narrow window before the term (30 chars)
         narrow_start = max(0, term_pos - 30)
         narrow_context = context_lower[narrow_start:term_pos + len(term) + 10]
 
-        has_left = any(lat in narrow_context for lat in LATERALITY_LEFT)
-        has_right = any(lat in narrow_context for lat in LATERALITY_RIGHT)
-        has_bilateral = any(lat in narrow_context for lat in LATERALITY_BILATERAL)
-
-        return has_left, has_right, has_bilateral
+        return _laterality_flags(narrow_context)
 
     # Direct lookup
     if term_lower in ANATOMICAL_MAPPINGS:
@@ -323,16 +379,14 @@ def enhance_region_detection(text: str, existing_regions: list = None) -> list:
     text_lower = text.lower()
 
     # Scan for anatomical terms
-    for term, regions in ANATOMICAL_MAPPINGS.items():
-        if term in text_lower:
-            # Get context window around the term (increased to 100 chars for better laterality detection)
-            term_index = text_lower.find(term)
-            context_start = max(0, term_index - 100)
-            context_end = min(len(text), term_index + len(term) + 100)
-            context = text[context_start:context_end]
-
-            # Map with laterality detection
-            mapped_regions = map_anatomical_term_to_regions(term, context)
-            detected_regions.update(mapped_regions)
+    for term, term_index in _find_anatomical_terms(text_lower).items():
+        # Get context window around the term (increased to 100 chars for better laterality detection)
+        context_start = max(0, term_index - 100)
+        context_end = min(len(text), term_index + len(term) + 100)
+        context = text[context_start:context_end]
+
+        # Map with laterality detection
+        mapped_regions = map_anatomical_term_to_regions(term, context)
+        detected_regions.update(mapped_regions)
 
     return list(detected_regions)
@@ -21,6 +21,7 @@ from .config import (
     REGION_MAP_PATH,
     AI_PARSED_JSON_PATH
 )
+from .search import precompute_damages_values
 
 
 @st.cache_resource
@@ -108,8 +109,9 @@ def detect_json_format(data: List[Dict[str, Any]]) -> str:
     if 'plaintiffs' in sample and isinstance(sample.get('plaintiffs'), list):
         return "ai_parsed"
 
-    # Dashboard format has 'embedding' and 'summary_text'
-    if 'embedding' in sample and 'summary_text' in sample:
+    # Dashboard format has 'summary_text' plus an inline 'embedding' or an
+    # 'embedding_idx' into the .embeddings.npy sidecar
+    if ('embedding' in sample or 'embedding_idx' in sample) and 'summary_text' in sample:
         return "dashboard"
 
     return "unknown"
@@ -189,9 +191,10 @@ def load_cases_auto() -> Optional[List[Dict[str, Any]]]:
 
                 # Save for future use
                 try:
+                    from data_transformer import write_dashboard_json
                     data_path.parent.mkdir(parents=True, exist_ok=True)
-                    with open(data_path, 'w') as f:
-                        json.dump(converted, f, indent=2)
+                    # Written case by case; indented JSON with inline embeddings is huge
+                    write_dashboard_json(converted, data_path)
                     st.success("✅ Converted data saved for faster loading next time!")
                 except Exception as e:
                     st.warning(f"⚠️ Could not save converted data: {str(e)}")
@@ -213,7 +216,11 @@ def load_cases_auto() -> Optional[List[Dict[str, Any]]]:
 @st.cache_data
 def _cached_load_cases() -> Optional[List[Dict[str, Any]]]:
     """Cached wrapper for load_cases_auto() to avoid re-computing on every rerun."""
-    return load_cases_auto()
+    cases = load_cases_auto()
+    if cases is not None:
+        # Cached with the cases, so damages are parsed once rather than per rerun
+        precompute_damages_values(cases)
+    return cases
 
 
 def initialize_data() -> tuple:
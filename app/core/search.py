@@ -15,6 +15,7 @@ import re
 from pathlib import Path
 from typing import Optional, List, Dict, Tuple, Any
 from collections import Counter
+import heapq
 import math
 
 from .medical_terms import expand_query_terms, get_expanded_query_text
@@ -34,13 +35,16 @@ def _ensure_embs_loaded():
     """Load embedding matrix and IDs once at module scope."""
     global _emb_matrix, _ids, _emb_norm
     if _emb_matrix is None:
-        _emb_matrix = np.load(str(EMB_PATH))
+        # Stored as int8 (float16 in older builds) and memory-mapped; only the
+        # normalized float32 copy used for similarities is held in RAM
+        _emb_matrix = np.load(str(EMB_PATH), mmap_mode='r')
         with open(IDS_PATH, "r", encoding="utf-8") as f:
             _ids = json.load(f)
         # Normalize rows for cosine similarity
-        norms = np.linalg.norm(_emb_matrix, axis=1, keepdims=True)
+        _emb_norm = _emb_matrix.astype(np.float32)
+        norms = np.linalg.norm(_emb_norm, axis=1, keepdims=True)
         norms[norms == 0] = 1.0
-        _emb_norm = _emb_matrix / norms
+        _emb_norm /= norms
 
 
 def _cosine_sim_batch(query_vec: np.ndarray, indices: Optional[List[int]]) -> np.ndarray:
@@ -518,6 +522,34 @@ def filter_outliers(
     return filtered_cases
 
 
+def summarize_damages(values: List[float]) -> Dict[str, Any]:
+    """
+    Summary statistics for a list of damages amounts.
+
+    Converts the list to one array and reduces it there, instead of each
+    statistic converting (or walking) the list again.
+
+    Args:
+        values: Damages amounts
+
+    Returns:
+        Dict with 'values' (the input list), 'mean', 'median', 'min', 'max'
+        and 'std' (all 0 for an empty list)
+    """
+    if not values:
+        return {'values': values, 'mean': 0, 'median': 0, 'min': 0, 'max': 0, 'std': 0}
+
+    arr = np.asarray(values, dtype=np.float64)
+    return {
+        'values': values,
+        'mean': arr.mean(),
+        'median': np.median(arr),
+        'min': arr.min(),
+        'max': arr.max(),
+        'std': arr.std(),
+    }
+
+
 def search_cases(
     query_text: str,
     selected_regions: List[str],
@@ -580,17 +612,24 @@ def search_cases(
     # Dual embedding system with medical term expansion:
     # 1. Full-text query embedding (for semantic search) - use expanded terms
     expanded_query_text = get_expanded_query_text(query_text)
-    qv_full = model.encode(expanded_query_text).astype("float32")
 
     # 2. Injury-specific query embedding (for injury-focused search)
     # If we have parsed injuries, use them with expansion; otherwise use full text
     injury_query_text = ", ".join(query_injuries) if query_injuries else query_text
     expanded_injury_text = get_expanded_query_text(injury_query_text)
-    qv_injury = model.encode(expanded_injury_text).astype("float32")
+
+    # Encode both query texts in one batch (once if they are the same text)
+    if expanded_injury_text == expanded_query_text:
+        qv_full = model.encode([expanded_query_text])[0].astype("float32")
+        qv_injury = qv_full
+    else:
+        qv_full, qv_injury = model.encode([expanded_query_text, expanded_injury_text]).astype("float32")
 
     # Stage 1: Exclusive category filtering
     candidate_indices = []
     case_index_map = {}
+    # Lowercase the selected categories once, not once per case
+    lower_sel = {str(c).strip().lower() for c in selected_regions} if selected_regions else set()
 
     for i, case in enumerate(cases):
         cid = case.get("id")
@@ -609,7 +648,6 @@ def search_cases(
 
             # Case-insensitive category overlap check
             lower_case_categories = {str(c).strip().lower() for c in case_categories}
-            lower_sel = {str(c).strip().lower() for c in selected_regions}
 
             if lower_case_categories & lower_sel:
                 candidate_indices.append(row_idx)
@@ -672,20 +710,19 @@ def search_cases(
         # For display, use the injury-specific semantic similarity as it's most relevant
         results.append((case, semantic_sim_injury, combined))
 
-    # Stage 4: Sort by score
-    results.sort(key=lambda t: t[2], reverse=True)
-
-    # Stage 5: Deduplicate by case name (keep highest scoring instance)
+    # Stage 4: Deduplicate by case name (keep highest scoring instance)
     # This prevents the same case appearing multiple times with different plaintiffs/sections
-    seen_cases = set()
-    dedup_results = []
-    for case, emb_sim, combined_score in results:
+    best_by_name = {}
+    for order, (case, emb_sim, combined_score) in enumerate(results):
         case_name = case.get('case_name', '').strip().lower()
-        if case_name and case_name not in seen_cases:
-            seen_cases.add(case_name)
-            dedup_results.append((case, emb_sim, combined_score))
+        if case_name:
+            kept = best_by_name.get(case_name)
+            if kept is None or combined_score > kept[0]:
+                best_by_name[case_name] = (combined_score, order, case, emb_sim)
 
-    return dedup_results[:top_n]
+    # Stage 5: Top N by score (ties keep candidate order, like a stable sort)
+    top = heapq.nsmallest(top_n, best_by_name.values(), key=lambda t: (-t[0], t[1]))
+    return [(case, emb_sim, combined_score) for combined_score, _, case, emb_sim in top]
 
 
 def extract_damages_value(case: Dict[str, Any]) -> Optional[float]:
@@ -701,6 +738,10 @@ def extract_damages_value(case: Dict[str, Any]) -> Optional[float]:
     Returns:
         Damages value as float, or None if not found
     """
+    # Value computed once at load time (see precompute_damages_values)
+    if "_damage_val" in case:
+        return case["_damage_val"]
+
     # Try direct damages field first (new format)
     if case.get("damages"):
         try:
@@ -737,6 +778,22 @@ def extract_damages_value(case: Dict[str, Any]) -> Optional[float]:
     return None
 
 
+def precompute_damages_values(cases: List[Dict[str, Any]]) -> None:
+    """
+    Store each case's extract_damages_value() result on the case.
+
+    Search, filters, charts and analytics all ask for the damages value of the
+    same cases on every rerun; with the value stored under '_damage_val',
+    extract_damages_value returns it without walking the fallback fields.
+
+    Args:
+        cases: Case dictionaries (modified in place)
+    """
+    for case in cases:
+        case.pop("_damage_val", None)
+        case["_damage_val"] = extract_damages_value(case)
+
+
 def boolean_search(
     query: str,
     cases: List[Dict[str, Any]],
@@ -789,6 +846,8 @@ def boolean_search(
 
     # Parse and evaluate the Boolean expression
     matching_cases = []
+    # Lowercase the selected categories once, not once per case
+    lower_sel = {str(c).strip().lower() for c in selected_regions} if selected_regions else set()
 
     for case in cases:
         # Apply year filter
@@ -818,7 +877,6 @@ def boolean_search(
                 continue
 
             lower_case_categories = {str(c).strip().lower() for c in case_categories}
-            lower_sel = {str(c).strip().lower() for c in selected_regions}
 
             if not (lower_case_categories & lower_sel):
                 continue
@@ -10,20 +10,21 @@ import plotly.graph_objects as go
 import plotly.express as px
 from typing import List, Dict, Any, Optional
 import pandas as pd
-import numpy as np
 from collections import Counter
 
 # Import inflation adjustment
 try:
-    from inflation_adjuster import adjust_for_inflation, DEFAULT_REFERENCE_YEAR
+    from inflation_adjuster import adjust_for_inflation, adjust_for_inflation_batch, DEFAULT_REFERENCE_YEAR
 except ImportError:
     # Fallback if module not available
     DEFAULT_REFERENCE_YEAR = 2024
     def adjust_for_inflation(amount, from_year, to_year):
         return None
+    def adjust_for_inflation_batch(amounts, from_years, to_year):
+        return [None] * len(amounts)
 
 # Import outlier filtering
-from app.core.search import filter_outliers
+from app.core.search import filter_outliers, summarize_damages
 
 
 def _load_valid_compendium_categories() -> set:
@@ -175,16 +176,15 @@ def calculate_category_statistics(category_cases: List[Dict[str, Any]], category
     total_cases = len(category_cases)
     is_fla_category = category_name.startswith("FLA: ")
 
-    # Extract damages values (both original and inflation-adjusted)
+    # Extract damages values and award years
     damages_values = []
-    adjusted_damages_values = []
+    award_years = []
 
     if is_fla_category:
         # For FLA categories, get the specific FLA claim amounts (case-insensitive)
         relationship_name = category_name[5:].strip().lower()
 
         for case in category_cases:
-            year = case.get('year')
             extended_data = case.get('extended_data', {})
             fla_claims = extended_data.get('family_law_act_claims', []) or []
 
@@ -195,29 +195,24 @@ def calculate_category_statistics(category_cases: List[Dict[str, Any]], category
 
                     if damage and damage > 0 and is_fla_award:
                         damages_values.append(damage)
-
-                        # Calculate inflation-adjusted value
-                        if year:
-                            adjusted = adjust_for_inflation(damage, year, DEFAULT_REFERENCE_YEAR)
-                            adjusted_damages_values.append(adjusted if adjusted else damage)
-                        else:
-                            adjusted_damages_values.append(damage)
+                        award_years.append(case.get('year') or 0)
                     break  # Only count first matching claim per case
     else:
         # Regular injury categories - use main damages field
         for case in category_cases:
             damage = case.get('damages')
-            year = case.get('year')
 
             if damage and damage > 0:
                 damages_values.append(damage)
+                award_years.append(case.get('year') or 0)
 
-                # Calculate inflation-adjusted value
-                if year:
-                    adjusted = adjust_for_inflation(damage, year, DEFAULT_REFERENCE_YEAR)
-                    adjusted_damages_values.append(adjusted if adjusted else damage)
-                else:
-                    adjusted_damages_values.append(damage)
+    # Inflation-adjust all awards in one pass; keep the original amount
+    # where the year or its CPI is unavailable (NaN/None)
+    adjusted = adjust_for_inflation_batch(damages_values, award_years, DEFAULT_REFERENCE_YEAR)
+    adjusted_damages_values = [
+        damage if pd.isna(adj) else float(adj)
+        for adj, damage in zip(adjusted, damages_values)
+    ]
 
     # Year distribution
     years = []
@@ -229,22 +224,8 @@ def calculate_category_statistics(category_cases: List[Dict[str, Any]], category
     stats = {
         'total_cases': total_cases,
         'cases_with_damages': len(damages_values),
-        'damages': {
-            'values': damages_values,
-            'mean': np.mean(damages_values) if damages_values else 0,
-            'median': np.median(damages_values) if damages_values else 0,
-            'min': min(damages_values) if damages_values else 0,
-            'max': max(damages_values) if damages_values else 0,
-            'std': np.std(damages_values) if damages_values else 0,
-        },
-        'adjusted_damages': {
-            'values': adjusted_damages_values,
-            'mean': np.mean(adjusted_damages_values) if adjusted_damages_values else 0,
-            'median': np.median(adjusted_damages_values) if adjusted_damages_values else 0,
-            'min': min(adjusted_damages_values) if adjusted_damages_values else 0,
-            'max': max(adjusted_damages_values) if adjusted_damages_values else 0,
-            'std': np.std(adjusted_damages_values) if adjusted_damages_values else 0,
-        },
+        'damages': summarize_damages(damages_values),
+        'adjusted_damages': summarize_damages(adjusted_damages_values),
         'years': {
             'all': years,
             'min': min(years) if years else None,
@@ -346,13 +327,28 @@ def display_category_analytics_page(cases: List[Dict[str, Any]], include_outlier
     st.header("🩺 Category Statistics")
     st.markdown("Explore award patterns and statistics by injury category or FLA relationship type. Compare different types of losses (e.g., injury categories vs. FLA claims).")
 
+    # Several sections below need the same category's cases and statistics;
+    # compute each once per page render
+    category_cases_cache = {}
+    category_stats_cache = {}
+
     # Helper function to get category cases with optional outlier filtering
     def get_filtered_category_cases(category_name: str) -> List[Dict[str, Any]]:
         """Get cases for a category, optionally filtering outliers."""
-        category_cases = get_category_cases(cases, category_name)
-        if not include_outliers and category_cases:
-            category_cases = filter_outliers(category_cases)
-        return category_cases
+        if category_name not in category_cases_cache:
+            category_cases = get_category_cases(cases, category_name)
+            if not include_outliers and category_cases:
+                category_cases = filter_outliers(category_cases)
+            category_cases_cache[category_name] = category_cases
+        return category_cases_cache[category_name]
+
+    def get_category_statistics(category_name: str) -> Dict[str, Any]:
+        """Get statistics for a category's (filtered) cases."""
+        if category_name not in category_stats_cache:
+            category_stats_cache[category_name] = calculate_category_statistics(
+                get_filtered_category_cases(category_name), category_name
+            )
+        return category_stats_cache[category_name]
 
     # Get all categories (injury and FLA)
     categories_dict = get_all_categories(cases)
@@ -399,7 +395,7 @@ def display_category_analytics_page(cases: List[Dict[str, Any]], include_outlier
         for category_name in selected_categories:
             category_cases = get_filtered_category_cases(category_name)
             if category_cases:
-                stats = calculate_category_statistics(category_cases, category_name)
+                stats = get_category_statistics(category_name)
                 comparison_data.append({
                     'Category': category_name,
                     'Sample Size': stats['total_cases'],
@@ -426,7 +422,7 @@ def display_category_analytics_page(cases: List[Dict[str, Any]], include_outlier
             for category_name in selected_categories:
                 category_cases = get_filtered_category_cases(category_name)
                 if category_cases:
-                    stats = calculate_category_statistics(category_cases, category_name)
+                    stats = get_category_statistics(category_name)
                     fig_comparison.add_trace(go.Bar(
                         name=category_name,
                         x=['Min Award', 'Median Award', 'Max Award'],
@@ -517,7 +513,7 @@ def display_category_analytics_page(cases: List[Dict[str, Any]], include_outlier
         for category_name in selected_categories:
             category_cases = get_filtered_category_cases(category_name)
             if category_cases:
-                stats = calculate_category_statistics(category_cases, category_name)
+                stats = get_category_statistics(category_name)
 
                 with st.expander(f"View {len(category_cases)} cases for {category_name}", expanded=False):
                     # Summary stats
@@ -604,7 +600,7 @@ def display_category_analytics_page(cases: List[Dict[str, Any]], include_outlier
         return
 
     # Calculate statistics
-    stats = calculate_category_statistics(category_cases, selected_category)
+    stats = get_category_statistics(selected_category)
 
     # Display overview metrics
     st.subheader(f"Overview: {selected_category}")
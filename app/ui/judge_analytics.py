@@ -10,7 +10,6 @@ import plotly.graph_objects as go
 import plotly.express as px
 from typing import List, Dict, Any, Optional
 import pandas as pd
-import numpy as np
 from collections import Counter
 import re
 
@@ -24,7 +23,7 @@ except ImportError:
         return None
 
 # Import outlier filtering
-from app.core.search import filter_outliers
+from app.core.search import filter_outliers, summarize_damages
 
 
 def get_all_judges(cases: List[Dict[str, Any]]) -> List[str]:
@@ -159,22 +158,8 @@ def calculate_judge_statistics(judge_cases: List[Dict[str, Any]]) -> Dict[str, A
     stats = {
         'total_cases': total_cases,
         'cases_with_damages': len(damages_values),
-        'damages': {
-            'values': damages_values,
-            'mean': np.mean(damages_values) if damages_values else 0,
-            'median': np.median(damages_values) if damages_values else 0,
-            'min': min(damages_values) if damages_values else 0,
-            'max': max(damages_values) if damages_values else 0,
-            'std': np.std(damages_values) if damages_values else 0,
-        },
-        'adjusted_damages': {
-            'values': adjusted_damages_values,
-            'mean': np.mean(adjusted_damages_values) if adjusted_damages_values else 0,
-            'median': np.median(adjusted_damages_values) if adjusted_damages_values else 0,
-            'min': min(adjusted_damages_values) if adjusted_damages_values else 0,
-            'max': max(adjusted_damages_values) if adjusted_damages_values else 0,
-            'std': np.std(adjusted_damages_values) if adjusted_damages_values else 0,
-        },
+        'damages': summarize_damages(damages_values),
+        'adjusted_damages': summarize_damages(adjusted_damages_values),
         'years': {
             'all': years,
             'min': min(years) if years else None,
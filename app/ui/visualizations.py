@@ -164,13 +164,14 @@ def calculate_chart_statistics(chart_data: List[Dict[str, Any]]) -> Dict[str, fl
     if not chart_data:
         return {}
 
-    median_original = np.median([d['original_award'] for d in chart_data])
-    median_adjusted = np.median([d['adjusted_award'] for d in chart_data])
+    # Pull each column out once; every statistic then reduces a float array
+    original = np.fromiter((d['original_award'] for d in chart_data), dtype=np.float64, count=len(chart_data))
+    adjusted = np.fromiter((d['adjusted_award'] for d in chart_data), dtype=np.float64, count=len(chart_data))
 
-    avg_inflation = np.mean([
-        ((d['adjusted_award'] - d['original_award']) / d['original_award']) * 100
-        for d in chart_data
-    ])
+    median_original = np.median(original)
+    median_adjusted = np.median(adjusted)
+
+    avg_inflation = (((adjusted - original) / original) * 100).mean()
 
     return {
         'median_original': median_original,
@@ -199,9 +200,11 @@ def create_damages_cap_chart(
     if not damages_values or len(damages_values) < 2:
         return None
 
-    min_val = np.min(damages_values)
-    median_val = np.median(damages_values)
-    max_val = np.max(damages_values)
+    # One conversion; min/median/max then reduce the same array
+    damages_array = np.asarray(damages_values, dtype=np.float64)
+    min_val = damages_array.min()
+    median_val = np.median(damages_array)
+    max_val = damages_array.max()
 
     # Calculate proportions relative to cap
     min_pct = (min_val / damages_cap) * 100
@@ -5,20 +5,104 @@ Build all embeddings for the Ontario Damages Compendium.
 This script combines the full workflow:
 1. Loads damages_table_based.json (authoritative source)
 2. Converts to dashboard format with full case embeddings
-3. Saves to data/damages_with_embeddings.json
+3. Saves to data/damages_with_embeddings.json (+ .embeddings.npy sidecar,
+   + .parquet with pyarrow)
 4. Generates injury-focused embeddings for semantic search
 5. Saves to data/compendium_inj.json, embeddings_inj.npy, ids.json
 
 One script to rule them all!
 """
 
-import json
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
+import torch
 from pathlib import Path
 from sentence_transformers import SentenceTransformer
-from data_transformer import convert_to_dashboard_format
-from tqdm import tqdm
+from data_transformer import (
+    PYARROW_AVAILABLE,
+    convert_to_dashboard_format,
+    load_embeddings_sidecar,
+    quantize_embeddings_int8,
+    read_json,
+    save_embeddings_sidecar,
+    write_dashboard_json,
+    write_dashboard_parquet,
+)
+
+# Opt-in: EMBEDDINGS_TORCH_COMPILE=1 compiles the transformer with torch.compile
+# (one-off compile cost, worth it for large GPU runs)
+TORCH_COMPILE = os.getenv("EMBEDDINGS_TORCH_COMPILE") == "1"
+
+# Token cap for the short injury search texts (all-mpnet-base-v2 was fine-tuned
+# on 128-token inputs; the 384 default only adds work on long injury lists)
+INJURY_MAX_SEQ_LENGTH = 128
+
+# Comment extraction: at least this many comments are split across processes
+COMMENT_PARALLEL_MIN_CASES = 2000
+COMMENT_PARALLEL_CHUNKSIZE = 256
+
+# Optional multi-pattern matcher for the comment anchor-word check
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+# Injury phrases looked for in comments (case-insensitive), compiled once at import
+_COMMENT_INJURY_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'\b(?:suffered?|sustained?|experienced?|diagnosed with)\s+([^.;,]+(?:injury|injuries|fracture|damage|trauma|pain|syndrome|disorder|impairment|loss|tear|rupture|herniation|sprain|strain|contusion|hemorrhage|bleeding|concussion))',
+    r'\b(brain (?:damage|injury|trauma|hemorrhage))',
+    r'\b(spinal cord (?:injury|damage))',
+    r'\b(traumatic brain injury|tbi)',
+    r'\b(post[- ]traumatic stress|ptsd)',
+    r'\b(complex regional pain syndrome|crps)',
+    r'\b(diffuse axonal injury)',
+    r'\b(herniated (?:disc|disk))',
+    r'\b(fractured? \w+)',
+    r'\b(torn \w+)',
+    r'\b(ruptured \w+)',
+    r'\b(\w+ fracture)',
+    r'\b(whiplash)',
+    r'\b(chronic pain)',
+    r'\b(paralysis|paraplegia|quadriplegia)',
+    r'\b(amputation)',
+    r'\b(vision loss|blindness|hearing loss)',
+    r'\b(internal (?:injuries|bleeding))',
+])
+# Words at least one of which appears in any text the patterns can match
+_COMMENT_INJURY_ANCHORS = (
+    'suffer', 'sustain', 'experienc', 'diagnos', 'brain', 'spinal', 'tbi', 'trauma', 'ptsd',
+    'regional', 'crps', 'axonal', 'herniat', 'fractur', 'torn', 'ruptur', 'whiplash', 'chronic',
+    'paralys', 'parapleg', 'quadripleg', 'amputat', 'vision', 'blind', 'hearing', 'internal',
+)
+
+
+def _build_anchor_automaton():
+    """Build an Aho-Corasick automaton over the comment anchor words (None without pyahocorasick)."""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for anchor in _COMMENT_INJURY_ANCHORS:
+        automaton.add_word(anchor, anchor)
+    automaton.make_automaton()
+    return automaton
+
+
+_COMMENT_ANCHOR_AUTOMATON = _build_anchor_automaton()
+
+
+# Case-insensitive anchor scan used when pyahocorasick is not installed
+_COMMENT_ANCHOR_RE = re.compile("|".join(_COMMENT_INJURY_ANCHORS), re.IGNORECASE)
+
+
+def _has_injury_anchor(text: str) -> bool:
+    """Whether text contains any comment anchor word, ignoring case (one pass)."""
+    if _COMMENT_ANCHOR_AUTOMATON is None:
+        return _COMMENT_ANCHOR_RE.search(text) is not None
+    return next(_COMMENT_ANCHOR_AUTOMATON.iter(text.lower()), None) is not None
 
 
 def extract_injuries_from_comments(comments: str) -> list:
@@ -34,38 +118,20 @@ def extract_injuries_from_comments(comments: str) -> list:
     Returns:
         List of extracted injury terms
     """
-    if not comments:
+    # Extracted terms must be longer than 3 characters
+    if not comments or len(comments) < 4:
         return []
 
-    # Common injury-related patterns
-    injury_patterns = [
-        r'\b(?:suffered?|sustained?|experienced?|diagnosed with)\s+([^.;,]+(?:injury|injuries|fracture|damage|trauma|pain|syndrome|disorder|impairment|loss|tear|rupture|herniation|sprain|strain|contusion|hemorrhage|bleeding|concussion))',
-        r'\b(brain (?:damage|injury|trauma|hemorrhage))',
-        r'\b(spinal cord (?:injury|damage))',
-        r'\b(traumatic brain injury|tbi)',
-        r'\b(post[- ]traumatic stress|ptsd)',
-        r'\b(complex regional pain syndrome|crps)',
-        r'\b(diffuse axonal injury)',
-        r'\b(herniated (?:disc|disk))',
-        r'\b(fractured? \w+)',
-        r'\b(torn \w+)',
-        r'\b(ruptured \w+)',
-        r'\b(\w+ fracture)',
-        r'\b(whiplash)',
-        r'\b(chronic pain)',
-        r'\b(paralysis|paraplegia|quadriplegia)',
-        r'\b(amputation)',
-        r'\b(vision loss|blindness|hearing loss)',
-        r'\b(internal (?:injuries|bleeding))',
-    ]
+    # Most comments mention no injury phrase at all; a single scan for the
+    # anchor words rules out most of them before any pattern runs
+    if not _has_injury_anchor(comments):
+        return []
 
     extracted = []
-    comments_lower = comments.lower()
 
-    for pattern in injury_patterns:
-        matches = re.finditer(pattern, comments_lower, re.IGNORECASE)
-        for match in matches:
-            injury = match.group(1) if match.lastindex else match.group(0)
+    # Every pattern has exactly one capture group, so findall yields its text
+    for pattern in _COMMENT_INJURY_RES:
+        for injury in pattern.findall(comments):
             injury = injury.strip()
             if injury and len(injury) > 3:
                 extracted.append(injury)
@@ -82,6 +148,32 @@ def extract_injuries_from_comments(comments: str) -> list:
     return unique_injuries[:10]  # Limit to top 10 extracted terms
 
 
+def extract_injuries_from_comments_batch(comments_list: list) -> list:
+    """
+    Run extract_injuries_from_comments over many comments.
+
+    Large batches are spread over a process pool (the work is pure-Python
+    regex, so threads would serialize on the GIL); small ones run inline
+    because starting workers would cost more than it saves.
+
+    Args:
+        comments_list: Comment texts
+
+    Returns:
+        One list of extracted injury terms per comment, in input order
+    """
+    workers = os.cpu_count() or 1
+    if workers < 2 or len(comments_list) < COMMENT_PARALLEL_MIN_CASES:
+        return [extract_injuries_from_comments(comments) for comments in comments_list]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(
+            extract_injuries_from_comments,
+            comments_list,
+            chunksize=COMMENT_PARALLEL_CHUNKSIZE
+        ))
+
+
 def main():
     print("=" * 70)
     print("BUILDING ALL EMBEDDINGS FOR DAMAGES COMPENDIUM")
@@ -91,8 +183,7 @@ def main():
     source_file = "damages_table_based.json"
     print(f"\n📂 Step 1: Loading source data from {source_file}...")
 
-    with open(source_file, 'r', encoding='utf-8') as f:
-        source_cases = json.load(f)
+    source_cases = read_json(source_file)
 
     print(f"   ✓ Loaded {len(source_cases):,} cases")
 
@@ -106,17 +197,44 @@ def main():
     print(f"   This model provides excellent medical terminology understanding")
     print(f"   (First run will download ~400MB model)")
 
-    # NOTE: No device parameter specified - auto-detects GPU if available
+    # NOTE: Uses a CUDA GPU in half precision when available, then Apple
+    # Silicon (MPS), otherwise CPU fp32
     # This script is meant for LOCAL development/embedding generation
     # GPU recommended: ~10-20 min vs 1-2 hours on CPU
     # For Streamlit app deployment, see app/core/data_loader.py (CPU-only)
-    model = SentenceTransformer("sentence-transformers/all-mpnet-base-v2")
-    print(f"   ✓ Model loaded")
+    if torch.cuda.is_available():
+        device = 'cuda'
+    elif getattr(torch.backends, 'mps', None) is not None and torch.backends.mps.is_available():
+        device = 'mps'
+    else:
+        device = 'cpu'
+        # Use every core for the forward pass; one inter-op thread avoids oversubscription
+        torch.set_num_threads(os.cpu_count() or 4)
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            pass  # Can only be set before the first parallel op in this process
+    model = SentenceTransformer("sentence-transformers/all-mpnet-base-v2", device=device)
+    if device == 'cuda':
+        # fp16 halves memory traffic; embeddings are stored as float16 anyway
+        model.half()
+    if TORCH_COMPILE and hasattr(torch, 'compile'):
+        # Batches are padded to different lengths, so compile for dynamic shapes
+        model[0].auto_model = torch.compile(model[0].auto_model, dynamic=True)
+    batch_size = 64 if device == 'cpu' else 128
+    print(f"   ✓ Model loaded on {device}{' (fp16)' if device == 'cuda' else ''}")
+    if TORCH_COMPILE:
+        print(f"   ✓ torch.compile enabled (first batches include compile time)")
 
     # STEP 3: Convert to dashboard format
     print(f"\n🔄 Step 3: Converting to dashboard format with full case embeddings...")
     print(f"   Preserves: injuries, FLA claims, comments, demographics")
-    dashboard_cases = convert_to_dashboard_format(source_cases, model)
+    dashboard_cases = convert_to_dashboard_format(
+        source_cases,
+        model,
+        batch_size=batch_size,
+        cache_path="data/embeddings_cache_all-mpnet-base-v2.pkl"
+    )
     print(f"   ✓ Converted {len(dashboard_cases):,} cases")
 
     # Verify FLA preservation
@@ -143,31 +261,50 @@ def main():
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     print(f"\n💾 Step 4: Saving dashboard data to {output_path}...")
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(dashboard_cases, f, indent=2, ensure_ascii=False)
+    # Embeddings go to a float16 .npy sidecar; JSON keeps only embedding_idx
+    sidecar_path = save_embeddings_sidecar(dashboard_cases, output_path)
+    write_dashboard_json(dashboard_cases, output_path)
 
     size_mb = output_path.stat().st_size / 1024 / 1024
     print(f"   ✓ Saved {size_mb:.1f} MB")
+    print(f"   ✓ Embeddings: {sidecar_path} ({sidecar_path.stat().st_size / 1024 / 1024:.1f} MB, float16)")
+
+    # Columnar copy for analytics (the Streamlit app still reads the JSON)
+    if PYARROW_AVAILABLE:
+        parquet_path = write_dashboard_parquet(
+            dashboard_cases,
+            output_path.with_suffix(".parquet"),
+            embeddings=load_embeddings_sidecar(output_path)
+        )
+        print(f"   ✓ Parquet: {parquet_path} ({parquet_path.stat().st_size / 1024 / 1024:.1f} MB, zstd)")
+    else:
+        print(f"   ⚠️  pyarrow not installed - skipping Parquet output")
 
     # STEP 5: Generate injury-focused embeddings
     print(f"\n🔄 Step 5: Generating injury-focused embeddings for semantic search...")
 
     ids = []
-    inj_embs = []
+    search_texts = []
     out_cases = []
-    cases_without_injuries = 0
     cases_with_extracted_injuries = 0
 
-    for c in tqdm(dashboard_cases, desc="Processing cases"):
-        # Build search_text from injuries only
+    # Fallback: Extract injuries from comments for cases with an empty list
+    case_injuries = []
+    fallback_comments = []
+    for c in dashboard_cases:
         ext = c.get("extended_data", {}) or {}
         injuries = ext.get("injuries") or []
+        if not injuries:
+            fallback_comments.append(ext.get("comments") or c.get("comments", ""))
+        case_injuries.append(injuries)
+    cases_without_injuries = len(fallback_comments)
+    extracted_iter = iter(extract_injuries_from_comments_batch(fallback_comments))
 
-        # Fallback: Extract injuries from comments if empty
+    # Metadata pass only; model.encode below shows its own progress bar
+    for c, injuries in zip(dashboard_cases, case_injuries):
+        # Build search_text from injuries only
         if not injuries:
-            cases_without_injuries += 1
-            comments = ext.get("comments") or c.get("comments", "")
-            extracted = extract_injuries_from_comments(comments)
+            extracted = next(extracted_iter)
             if extracted:
                 injuries = extracted
                 cases_with_extracted_injuries += 1
@@ -182,31 +319,39 @@ def main():
 
         c['search_text'] = search_text
 
-        # Compute embedding
-        emb = model.encode(search_text).astype("float32")
-        c['inj_emb'] = emb.tolist()
-
         ids.append(c['id'])
-        inj_embs.append(emb)
+        search_texts.append(search_text)
         out_cases.append(c)
 
+    # Embed each distinct search text once, in batches, then expand back to one
+    # row per case (stored only in embeddings_inj.npy, row = ids.json index).
+    # encode() sorts the texts by length internally so each batch pads little.
+    unique_texts = {}
+    text_rows = [unique_texts.setdefault(text, len(unique_texts)) for text in search_texts]
+    print(f"   ✓ {len(unique_texts):,} distinct search texts for {len(search_texts):,} cases")
+    model.max_seq_length = INJURY_MAX_SEQ_LENGTH
+    inj_embs = model.encode(
+        list(unique_texts),
+        batch_size=batch_size,
+        convert_to_numpy=True,
+        show_progress_bar=True
+    )[text_rows]
+
     # STEP 6: Save injury embeddings
     data_dir = Path("data")
     data_dir.mkdir(exist_ok=True)
 
     print("\n💾 Step 6: Saving injury-focused embeddings...")
 
-    # Save cases with search_text and embeddings
-    with open(data_dir / "compendium_inj.json", "w", encoding="utf-8") as f:
-        json.dump(out_cases, f, ensure_ascii=False, indent=2)
+    # Save cases with search_text (embeddings live in the .npy matrix)
+    write_dashboard_json(out_cases, data_dir / "compendium_inj.json")
 
-    # Save embedding matrix for fast load
-    emb_matrix = np.vstack(inj_embs)
+    # Save embedding matrix for fast load (int8 is a quarter of float32; search upcasts)
+    emb_matrix = quantize_embeddings_int8(inj_embs)
     np.save(data_dir / "embeddings_inj.npy", emb_matrix)
 
     # Save case IDs for mapping
-    with open(data_dir / "ids.json", "w", encoding="utf-8") as f:
-        json.dump(ids, f)
+    write_dashboard_json(ids, data_dir / "ids.json")
 
     print(f"   ✓ compendium_inj.json: {(data_dir / 'compendium_inj.json').stat().st_size / 1024 / 1024:.1f} MB")
     print(f"   ✓ embeddings_inj.npy: {(data_dir / 'embeddings_inj.npy').stat().st_size / 1024 / 1024:.1f} MB")
@@ -227,8 +372,11 @@ def main():
     print(f"   • Still missing: {cases_without_injuries - cases_with_extracted_injuries}")
     print(f"\n📁 Output Files:")
     print(f"   • data/damages_with_embeddings.json (dashboard format)")
+    print(f"   • data/damages_with_embeddings.embeddings.npy (case embeddings, float16)")
+    if PYARROW_AVAILABLE:
+        print(f"   • data/damages_with_embeddings.parquet (columnar cases + embeddings)")
     print(f"   • data/compendium_inj.json (injury-focused)")
-    print(f"   • data/embeddings_inj.npy (embedding matrix)")
+    print(f"   • data/embeddings_inj.npy (embedding matrix, int8)")
     print(f"   • data/ids.json (case ID mapping)")
     print(f"\n💡 Next step: Restart Streamlit app to load new data")
     print(f"   streamlit run streamlit_app.py")
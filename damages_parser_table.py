@@ -36,41 +36,284 @@ Usage:
 import json
 import time
 import re
+import copy
+import hashlib
+import sqlite3
+import threading
+import queue
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Set, Tuple
+from typing import List, Dict, Any, Optional, Set, Tuple, Iterator, Iterable
 import camelot
 import requests
-from collections import deque
+from requests.adapters import HTTPAdapter
+from concurrent.futures import Future, ThreadPoolExecutor
+from PyPDF2 import PdfReader
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _extract_json_object(text: str) -> Optional[str]:
+    """
+    Find the first balanced JSON object in text.
+
+    Scans from the first '{' to its matching '}' while honouring string
+    quoting and escapes, so prose or code fences around the object are
+    ignored without any regex backtracking.
+
+    Args:
+        text: Raw model output
+
+    Returns:
+        The JSON object substring, or None if no balanced object is found
+    """
+    start = text.find('{')
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+
+    for i in range(start, len(text)):
+        char = text[i]
+        if escaped:
+            escaped = False
+            continue
+        if char == '\\':
+            escaped = True
+            continue
+        if char == '"':
+            in_string = not in_string
+            continue
+        if in_string:
+            continue
+        if char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+
+    return None
+
+
+def _loads_json_object(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse the first JSON object embedded in text.
+
+    Args:
+        text: Raw model output (tool-call arguments or message content)
+
+    Returns:
+        Parsed dict, or None if no valid object is present
+    """
+    if not isinstance(text, str):
+        return text if isinstance(text, dict) else None
+
+    json_text = _extract_json_object(text)
+    if json_text is None:
+        return None
+
+    try:
+        if ORJSON_AVAILABLE:
+            return orjson.loads(json_text)
+        return json.loads(json_text)
+    except ValueError:
+        return None
+
+
+def _write_json(obj: Any, path: str) -> None:
+    """Write obj as indented JSON, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2)
+
+
+def _dumps_json_line(obj: Any) -> bytes:
+    """Serialize obj as one compact JSON line (bytes, newline-terminated)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj) + b'\n'
+    return (json.dumps(obj) + '\n').encode('utf-8')
+
+
+# Common section patterns (uppercase headings), in priority order
+_SECTION_HEADERS = [
+    "BRAIN & SKULL", "BRAIN AND SKULL",
+    "HEAD",
+    "CERVICAL SPINE",
+    "THORACIC SPINE",
+    "LUMBAR SPINE",
+    "SPINE",
+    "NECK",
+    "SHOULDER",
+    "ARM", "ARMS",
+    "ELBOW",
+    "WRIST", "HAND",
+    "CHEST", "THORAX",
+    "ABDOMEN",
+    "PELVIS",
+    "HIP",
+    "KNEE",
+    "LEG", "LEGS",
+    "ANKLE", "FOOT",
+    "PSYCHOLOGICAL", "PSYCHIATRIC",
+    "MULTIPLE INJURIES",
+    "SOFT TISSUE",
+]
+_SECTION_HEADER_PRIORITY = {section: i for i, section in enumerate(_SECTION_HEADERS)}
+# Standalone section names (not part of another word), compiled once
+_SECTION_HEADER_RE = re.compile(
+    r'\b(' + '|'.join(re.escape(section) for section in _SECTION_HEADERS) + r')\b'
+)
+
+
+# Header cells (lowercased) that mark a table as a case table
+_TABLE_HEADER_KEYWORDS = frozenset({'plaintiff', 'case', 'year', 'defendant'})
+
+# Header keywords for the columns that identify a case (name/citation)
+_IDENTITY_COLUMN_KEYWORDS = ('plaintiff', 'defendant', 'case', 'citation')
+
+# A cell holding nothing but a dollar amount, e.g. "$85,000" or "12,500.00"
+_AMOUNT_CELL_RE = re.compile(r'^\$?\s*\d[\d,]*(?:\.\d+)?$')
+
+
+def _nullable_schema(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Allow null in a JSON schema (used for optional properties in strict mode)."""
+    schema = dict(schema)
+    if 'anyOf' in schema:
+        if not any(option.get('type') == 'null' for option in schema['anyOf']):
+            schema['anyOf'] = schema['anyOf'] + [{"type": "null"}]
+        return schema
+
+    schema_type = schema.get('type')
+    if isinstance(schema_type, str) and schema_type != 'null':
+        schema['type'] = [schema_type, 'null']
+    elif isinstance(schema_type, list) and 'null' not in schema_type:
+        schema['type'] = schema_type + ['null']
+
+    if 'enum' in schema and None not in schema['enum']:
+        schema['enum'] = schema['enum'] + [None]
+    return schema
+
+
+def _strict_json_schema(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Rewrite a JSON schema for OpenAI strict structured outputs.
+
+    Strict mode needs every property listed in required, no additional
+    properties and anyOf instead of oneOf, so optional properties become
+    required-but-nullable. The input schema is not modified.
+    """
+    schema = dict(schema)
+    if 'oneOf' in schema:
+        schema['anyOf'] = schema.pop('oneOf')
+    if 'anyOf' in schema:
+        schema['anyOf'] = [_strict_json_schema(option) for option in schema['anyOf']]
+    if 'items' in schema:
+        schema['items'] = _strict_json_schema(schema['items'])
+
+    if 'properties' in schema:
+        required = set(schema.get('required', []))
+        properties = {}
+        for name, prop in schema['properties'].items():
+            prop = _strict_json_schema(prop)
+            properties[name] = prop if name in required else _nullable_schema(prop)
+        schema['properties'] = properties
+        schema['required'] = list(properties)
+        schema['additionalProperties'] = False
+
+    return schema
+
+
+def _strict_tool(tool: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a strict-mode copy of a function tool definition."""
+    function = dict(tool["function"])
+    function["parameters"] = _strict_json_schema(function["parameters"])
+    function["strict"] = True
+    return {**tool, "function": function}
 
 
 class RateLimiter:
-    """Rate limiter to control API requests per minute."""
+    """
+    Token-bucket rate limiter to control API requests per minute (thread-safe).
+
+    The bucket holds up to requests_per_minute tokens and refills
+    continuously. Each request takes one token; when the bucket is empty the
+    token is reserved (balance goes negative) and the caller sleeps outside
+    the lock until it has been refilled, so concurrent workers queue fairly.
+    """
 
     def __init__(self, requests_per_minute: int = 200):
         self.requests_per_minute = requests_per_minute
-        self.request_times: deque = deque()
-        self.window_seconds = 60.0
+        self.capacity = float(requests_per_minute)
+        self.rate = requests_per_minute / 60.0  # tokens per second
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
 
-    def wait_if_needed(self):
+    def wait_if_needed(self, cost: float = 1.0):
         """Wait if necessary to stay within rate limits."""
-        now = time.time()
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            self.tokens -= cost
+            sleep_time = -self.tokens / self.rate if self.tokens < 0 else 0.0
 
-        # Remove requests older than our window
-        while self.request_times and self.request_times[0] < now - self.window_seconds:
-            self.request_times.popleft()
+        if sleep_time > 0:
+            time.sleep(sleep_time)
 
-        # If we're at the limit, wait
-        if len(self.request_times) >= self.requests_per_minute:
-            oldest_request = self.request_times[0]
-            sleep_time = (oldest_request + self.window_seconds) - now
-            if sleep_time > 0:
-                time.sleep(sleep_time)
-                now = time.time()
-                while self.request_times and self.request_times[0] < now - self.window_seconds:
-                    self.request_times.popleft()
 
-        # Record this request
-        self.request_times.append(time.time())
+class ResponseCache:
+    """
+    Persistent key-value cache for parsed API responses.
+
+    Backed by a single SQLite file so re-runs over the same (static) PDF
+    skip the API entirely. Safe to share across worker threads.
+    """
+
+    def __init__(self, path: str = ".damages_cache.sqlite"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(model: str, prompt: str) -> str:
+        """Build a cache key from the model name and the exact prompt text."""
+        return hashlib.sha256(f"{model}\x00{prompt}".encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached response for key, or None on a miss."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a response under key."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value) VALUES (?, ?)",
+                (key, json.dumps(value))
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
 
 
 class TableBasedParser:
@@ -83,17 +326,8 @@ class TableBasedParser:
     - Deterministic merging
     """
 
-    # Row parsing prompt - uses structured column:value format for better LLM parsing
-    ROW_PROMPT = """Parse this table row from a legal damages compendium.
-
-ANATOMICAL CATEGORY: {section}
-
-DATA FROM TABLE:
-{row_data_formatted}
-
-Call the extract_case_row function with the parsed data.
-
-CRITICAL RULES:
+    # Parsing rules shared by the single-row and multi-row prompts
+    ROW_RULES = """CRITICAL RULES:
 
 1. CONTINUATION ROWS:
    - Set is_continuation: true ONLY if BOTH case name AND citation are missing/null
@@ -124,6 +358,29 @@ CRITICAL RULES:
    - Preserve hyphenated surnames (e.g., 'Harrison-Young')
 """
 
+    # Static prompt prefix, sent as the system message. Identical for every
+    # row of a section, so providers can serve it from their prompt cache.
+    ROW_PREFIX = """Parse table rows from a legal damages compendium.
+
+""" + ROW_RULES + """
+ANATOMICAL CATEGORY: {section}
+"""
+
+    # Row parsing prompt - uses structured column:value format for better LLM parsing
+    ROW_PROMPT = """DATA FROM TABLE:
+{row_data_formatted}
+
+Call the extract_case_row function with the parsed data."""
+
+    # Multi-row prompt - amortizes the rules over several rows of one table
+    ROWS_PROMPT = """Parse these {num_rows} table rows.
+
+DATA FROM TABLE:
+{rows_formatted}
+
+Call the extract_case_rows function with exactly {num_rows} entries in "rows",
+one per input row, in the same order. Apply the rules to each row independently."""
+
     # Tool definition for structured extraction
     CASE_EXTRACTION_TOOL = {
         "type": "function",
@@ -251,6 +508,26 @@ CRITICAL RULES:
         }
     }
 
+    # Multi-row variant of the extraction tool (one entry per input row)
+    CASE_ROWS_EXTRACTION_TOOL = {
+        "type": "function",
+        "function": {
+            "name": "extract_case_rows",
+            "description": "Extract structured case information from several legal damages compendium table rows",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "rows": {
+                        "type": "array",
+                        "items": CASE_EXTRACTION_TOOL["function"]["parameters"],
+                        "description": "One entry per input row, in input order"
+                    }
+                },
+                "required": ["rows"]
+            }
+        }
+    }
+
     def __init__(
         self,
         endpoint: str,
@@ -258,7 +535,11 @@ CRITICAL RULES:
         model: str,
         api_version: str = "2024-02-15-preview",
         verbose: bool = True,
-        rate_limiter: Optional[RateLimiter] = None
+        rate_limiter: Optional[RateLimiter] = None,
+        max_workers: int = 8,
+        cache_path: Optional[str] = ".damages_cache.sqlite",
+        parallel_pages: bool = True,
+        rows_per_request: int = 10
     ):
         """
         Initialize the table-based parser.
@@ -270,6 +551,10 @@ CRITICAL RULES:
             api_version: Azure API version
             verbose: Whether to print progress
             rate_limiter: Optional rate limiter
+            max_workers: Number of rows parsed concurrently per table
+            cache_path: SQLite file for cached responses (None disables caching)
+            parallel_pages: Let Camelot parse pages across CPU cores
+            rows_per_request: Rows sent together in one LLM prompt (1 = per-row)
         """
         self.endpoint = endpoint.rstrip('/')
         self.api_key = api_key
@@ -277,7 +562,29 @@ CRITICAL RULES:
         self.api_version = api_version
         self.verbose = verbose
         self.rate_limiter = rate_limiter
+        self.max_workers = max(1, max_workers)
+        self.parallel_pages = parallel_pages
+        self.rows_per_request = max(1, rows_per_request)
         self.errors: List[Dict[str, Any]] = []
+        self.cache = ResponseCache(cache_path) if cache_path else None
+
+        # Identical prompts in flight at the same time share one request
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+        # Formatted ROW_PREFIX by section
+        self._prefix_cache: Dict[str, str] = {}
+
+        # Reuse one pooled session so rows share keep-alive TLS connections
+        pool_size = max(50, self.max_workers)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session = requests.Session()
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            "Content-Type": "application/json",
+            "api-key": self.api_key,
+        })
 
         # Detect model type
         self.is_claude = 'claude' in model.lower()
@@ -290,13 +597,119 @@ CRITICAL RULES:
             'chatgpt-4o' in model_lower
         ])
 
+        # The same model families support strict (schema-guaranteed) tool calls
+        self.supports_strict_tools = self.uses_max_completion_tokens and not self.is_claude
+        self._strict_tools = {
+            tool["function"]["name"]: _strict_tool(tool)
+            for tool in (self.CASE_EXTRACTION_TOOL, self.CASE_ROWS_EXTRACTION_TOOL)
+        }
+
         # Temperature settings
         if any(x in model_lower for x in ['claude-3-5', '3.5-sonnet', '5-sonnet', 'sonnet-3-5', 'nano']):
             self.temperature = 1.0
         else:
             self.temperature = 0.1
 
-    def _call_api(self, prompt: str, max_retries: int = 3, use_tools: bool = True) -> Optional[Dict[str, Any]]:
+    def close(self):
+        """Close the pooled HTTP session and response cache."""
+        self.session.close()
+        if self.cache:
+            self.cache.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _chat_completions_url(self) -> str:
+        """Build the chat completions URL for the configured model."""
+        if self.is_claude:
+            return f"{self.endpoint}/models/{self.model}/chat/completions"
+        return f"{self.endpoint}/openai/deployments/{self.model}/chat/completions?api-version={self.api_version}"
+
+    def _build_payload(
+        self,
+        prompt: str,
+        tool: Optional[Dict[str, Any]] = None,
+        max_tokens: int = 2048,
+        system: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build the chat completions request body for a row prompt."""
+        tool = tool or self.CASE_EXTRACTION_TOOL
+        if self.supports_strict_tools:
+            tool = self._strict_tools.get(tool["function"]["name"], tool)
+
+        messages = []
+        if system:
+            if self.is_claude:
+                # Claude only caches prefixes explicitly marked with cache_control;
+                # OpenAI models cache long identical prefixes automatically
+                system_content = [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}]
+            else:
+                system_content = system
+            messages.append({"role": "system", "content": system_content})
+        messages.append({"role": "user", "content": prompt})
+
+        payload = {
+            "messages": messages,
+            "temperature": self.temperature,
+            "tools": [tool],
+            "tool_choice": {"type": "function", "function": {"name": tool["function"]["name"]}}
+        }
+
+        if tool["function"].get("strict"):
+            # Strict schema adherence is only guaranteed for a single tool call
+            payload["parallel_tool_calls"] = False
+
+        if self.uses_max_completion_tokens:
+            payload["max_completion_tokens"] = max_tokens
+        else:
+            payload["max_tokens"] = max_tokens
+
+        return payload
+
+    @staticmethod
+    def _extract_tool_call(result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Extract the extract_case_row arguments from a chat completions response.
+
+        Args:
+            result: Decoded chat completions response body
+
+        Returns:
+            Parsed tool-call arguments, or None if the response has none
+        """
+        choices = result.get("choices") or []
+        if not choices:
+            return None
+
+        message = choices[0].get("message", {})
+        tool_calls = message.get("tool_calls") or []
+        if not tool_calls:
+            return None
+
+        tool_call = tool_calls[0]
+        if tool_call.get("type") != "function":
+            return None
+
+        function_args = tool_call.get("function", {}).get("arguments", "{}")
+        return _loads_json_object(function_args)
+
+    @staticmethod
+    def _cache_text(prompt: str, system: Optional[str]) -> str:
+        """Combine system prefix and prompt into the text used for cache keys."""
+        return f"{system}\x00{prompt}" if system else prompt
+
+    def _call_api(
+        self,
+        prompt: str,
+        max_retries: int = 3,
+        use_tools: bool = True,
+        tool: Optional[Dict[str, Any]] = None,
+        max_tokens: int = 2048,
+        system: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Call Azure API with tool calling support.
 
@@ -304,6 +717,9 @@ CRITICAL RULES:
             prompt: The prompt text
             max_retries: Number of retry attempts
             use_tools: Whether to use function calling (must be True)
+            tool: Tool definition to force (defaults to CASE_EXTRACTION_TOOL)
+            max_tokens: Output token budget
+            system: Static prompt prefix sent as the system message
 
         Returns:
             Dict with 'tool_call' key containing extracted data, or None on error
@@ -311,49 +727,67 @@ CRITICAL RULES:
         if not use_tools:
             raise ValueError("Tool calling is required - old models without tool support are not supported")
 
-        if self.rate_limiter:
-            self.rate_limiter.wait_if_needed()
-
-        headers = {
-            "Content-Type": "application/json",
-            "api-key": self.api_key,
-        }
+        # Prompts are deterministic per row, so exact-match caching is safe
+        cache_key = ResponseCache.make_key(self.model, self._cache_text(prompt, system))
+        if self.cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        # Coalesce duplicate prompts onto whichever worker sent them first
+        with self._inflight_lock:
+            future = self._inflight.get(cache_key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[cache_key] = future
+
+        if not is_owner:
+            # Callers mutate parsed rows, so each gets its own copy
+            return copy.deepcopy(future.result())
 
-        # Determine URL based on model type
-        if self.is_claude:
-            url = f"{self.endpoint}/models/{self.model}/chat/completions"
-        else:
-            url = f"{self.endpoint}/openai/deployments/{self.model}/chat/completions?api-version={self.api_version}"
+        try:
+            result = self._post_chat_completion(prompt, max_retries, tool, max_tokens, system)
+            if result is not None and self.cache:
+                self.cache.set(cache_key, result)
+            future.set_result(result)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[cache_key]
+
+        return copy.deepcopy(result)
+
+    def _post_chat_completion(
+        self,
+        prompt: str,
+        max_retries: int,
+        tool: Optional[Dict[str, Any]],
+        max_tokens: int,
+        system: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Send one chat completions request, retrying on rate limits and errors.
 
-        payload = {
-            "messages": [{"role": "user", "content": prompt}],
-            "temperature": self.temperature,
-            "tools": [self.CASE_EXTRACTION_TOOL],
-            "tool_choice": {"type": "function", "function": {"name": "extract_case_row"}}
-        }
+        Returns:
+            Dict with 'tool_call' key containing extracted data, or None on error
+        """
+        if self.rate_limiter:
+            self.rate_limiter.wait_if_needed()
 
-        if self.uses_max_completion_tokens:
-            payload["max_completion_tokens"] = 2048
-        else:
-            payload["max_tokens"] = 2048
+        url = self._chat_completions_url()
+        payload = self._build_payload(prompt, tool=tool, max_tokens=max_tokens, system=system)
 
         for attempt in range(max_retries):
             try:
-                response = requests.post(url, json=payload, headers=headers, timeout=60)
+                response = self.session.post(url, json=payload, timeout=(5, 60))
 
                 if response.status_code == 200:
-                    result = response.json()
-                    if "choices" in result and len(result["choices"]) > 0:
-                        choice = result["choices"][0]
-                        message = choice.get("message", {})
-
-                        # Extract tool call
-                        if "tool_calls" in message and len(message["tool_calls"]) > 0:
-                            tool_call = message["tool_calls"][0]
-                            if tool_call.get("type") == "function":
-                                function_args = tool_call.get("function", {}).get("arguments", "{}")
-                                import json
-                                return {"tool_call": json.loads(function_args)}
+                    parsed_args = self._extract_tool_call(response.json())
+                    if parsed_args is not None:
+                        return {"tool_call": parsed_args}
 
                     if self.verbose:
                         print(f"  No tool call in response")
@@ -602,41 +1036,19 @@ CRITICAL RULES:
         if not page_text:
             return "UNKNOWN"
 
-        # Common section patterns (uppercase headings)
-        sections = [
-            "BRAIN & SKULL", "BRAIN AND SKULL",
-            "HEAD",
-            "CERVICAL SPINE",
-            "THORACIC SPINE",
-            "LUMBAR SPINE",
-            "SPINE",
-            "NECK",
-            "SHOULDER",
-            "ARM", "ARMS",
-            "ELBOW",
-            "WRIST", "HAND",
-            "CHEST", "THORAX",
-            "ABDOMEN",
-            "PELVIS",
-            "HIP",
-            "KNEE",
-            "LEG", "LEGS",
-            "ANKLE", "FOOT",
-            "PSYCHOLOGICAL", "PSYCHIATRIC",
-            "MULTIPLE INJURIES",
-            "SOFT TISSUE",
-        ]
-
         # Look for section header in first 500 chars
         text_upper = page_text[:500].upper()
 
-        for section in sections:
-            # Look for standalone section name (not part of another word)
-            pattern = r'\b' + re.escape(section) + r'\b'
-            if re.search(pattern, text_upper):
-                return section
+        # Single scan over all headers; earlier list entries take priority
+        best_priority = None
+        for match in _SECTION_HEADER_RE.finditer(text_upper):
+            priority = _SECTION_HEADER_PRIORITY[match.group(1)]
+            if best_priority is None or priority < best_priority:
+                best_priority = priority
+                if priority == 0:
+                    break
 
-        return "UNKNOWN"
+        return _SECTION_HEADERS[best_priority] if best_priority is not None else "UNKNOWN"
 
     def _clean_section_header(self, section_text: str) -> str:
         """
@@ -766,7 +1178,12 @@ CRITICAL RULES:
 
         try:
             # Use stream mode to capture section headers
-            tables_stream = camelot.read_pdf(pdf_path, pages=page_spec, flavor="stream")
+            tables_stream = camelot.read_pdf(
+                pdf_path,
+                pages=page_spec,
+                flavor="stream",
+                parallel=self.parallel_pages
+            )
 
             for table in tables_stream:
                 page_num = table.page
@@ -774,7 +1191,7 @@ CRITICAL RULES:
 
                 if len(df_stream) > 0:
                     # Extract first non-empty cell from row 0 as section header
-                    row0_values = df_stream.iloc[0].tolist()
+                    row0_values = df_stream.values[0].tolist()
                     section_found = None
 
                     for cell in row0_values:
@@ -810,7 +1227,8 @@ CRITICAL RULES:
             tables = camelot.read_pdf(
                 pdf_path,
                 pages=page_spec,
-                flavor="lattice"
+                flavor="lattice",
+                parallel=self.parallel_pages
                 # Don't strip newlines - we need them for header detection
             )
             return tables if tables else []
@@ -838,40 +1256,259 @@ CRITICAL RULES:
         Returns:
             Parsed row data or None if parsing fails
         """
-        # Format row data for prompt
+        row_prompt = self._build_row_prompt(row, columns, section)
+        if row_prompt is None:
+            return None
+        system, prompt = row_prompt
+
+        # Rows that parse deterministically need no LLM call
+        is_continuation = self._classify_continuation(row, columns)
+        local_data = self._parse_row_locally(row, columns, is_continuation)
+        if local_data is not None:
+            return self._finalize_row_data(local_data, section, page_number)
+
+        api_response = self._call_api(prompt, use_tools=True, system=system)
+
+        if api_response and "tool_call" in api_response:
+            return self._finalize_row_data(api_response["tool_call"], section, page_number, is_continuation)
+
+        if self.verbose:
+            print(f"  No tool call response received")
+        return None
+
+    @staticmethod
+    def _format_row_data(row: List[str], columns: List[str]) -> Optional[str]:
+        """
+        Format a row as "Column: value" lines, skipping empty cells.
+
+        Returns:
+            Formatted row text, or None if the row has no non-empty cells
+        """
         row_data = []
-        for i, (col, val) in enumerate(zip(columns, row)):
+        for col, val in zip(columns, row):
             if val and val.strip():
                 row_data.append(f"{col}: {val.strip()}")
 
-        if not row_data:
+        return "\n".join(row_data) if row_data else None
+
+    def _row_prefix(self, section: str) -> str:
+        """Return ROW_PREFIX formatted for a section, formatting it once per section."""
+        prefix = self._prefix_cache.get(section)
+        if prefix is None:
+            prefix = self.ROW_PREFIX.format(section=section)
+            self._prefix_cache[section] = prefix
+        return prefix
+
+    def _build_row_prompt(
+        self,
+        row: List[str],
+        columns: List[str],
+        section: str
+    ) -> Optional[Tuple[str, str]]:
+        """
+        Build the LLM prompt for a table row.
+
+        Returns:
+            Tuple of (static system prefix, row prompt), or None if the row
+            has no non-empty cells
+        """
+        row_data_formatted = self._format_row_data(row, columns)
+        if row_data_formatted is None:
             return None
 
-        row_data_formatted = "\n".join(row_data)
+        return self._row_prefix(section), self.ROW_PROMPT.format(row_data_formatted=row_data_formatted)
+
+    def parse_rows_batch(
+        self,
+        rows: List[List[str]],
+        columns: List[str],
+        section: str,
+        page_number: int
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Parse several rows of one table with a single LLM call.
+
+        Rows that parse deterministically are built locally; the rest share one prompt.
+        If the model returns the wrong number of entries, falls back to
+        per-row parsing for this batch.
+
+        Args:
+            rows: List of rows (each a list of cell values)
+            columns: List of column headers
+            section: Body region/section name
+            page_number: Page number (for logging)
+
+        Returns:
+            Parsed row data aligned with rows (None where parsing failed)
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(rows)
+        llm_indices = []
+        llm_blocks = []
+        continuation_flags = {}
+
+        for i, row in enumerate(rows):
+            row_data_formatted = self._format_row_data(row, columns)
+            if row_data_formatted is None:
+                continue
+
+            is_continuation = self._classify_continuation(row, columns)
+            continuation_flags[i] = is_continuation
+            local_data = self._parse_row_locally(row, columns, is_continuation)
+            if local_data is not None:
+                results[i] = self._finalize_row_data(local_data, section, page_number)
+                continue
 
-        prompt = self.ROW_PROMPT.format(
-            section=section,
-            row_data_formatted=row_data_formatted
+            llm_indices.append(i)
+            llm_blocks.append(f"ROW {len(llm_blocks) + 1}:\n{row_data_formatted}")
+
+        if len(llm_indices) == 1:
+            i = llm_indices[0]
+            results[i] = self.parse_row(rows[i], columns, section, page_number)
+            return results
+
+        if not llm_indices:
+            return results
+
+        prompt = self.ROWS_PROMPT.format(
+            num_rows=len(llm_blocks),
+            rows_formatted="\n\n".join(llm_blocks)
+        )
+        api_response = self._call_api(
+            prompt,
+            use_tools=True,
+            tool=self.CASE_ROWS_EXTRACTION_TOOL,
+            max_tokens=max(2048, 1024 * len(llm_blocks)),
+            system=self._row_prefix(section)
         )
 
-        api_response = self._call_api(prompt, use_tools=True)
+        parsed = (api_response or {}).get("tool_call", {}).get("rows")
+        if not isinstance(parsed, list) or len(parsed) != len(llm_indices):
+            if self.verbose:
+                print(f"  Batch row count mismatch, parsing {len(llm_indices)} rows individually")
+            for i in llm_indices:
+                results[i] = self.parse_row(rows[i], columns, section, page_number)
+            return results
 
-        if api_response and "tool_call" in api_response:
-            data = api_response["tool_call"]
-            data['source_page'] = page_number
-            data['category'] = section
-            data['region'] = [section] if section else []
+        for i, data in zip(llm_indices, parsed):
+            if isinstance(data, dict):
+                results[i] = self._finalize_row_data(data, section, page_number, continuation_flags[i])
 
-            # Normalize judge name to last name only
-            if data.get('judge'):
-                data['judge'] = self.normalize_judge_name(data['judge'])
+        return results
 
-            return data
+    @staticmethod
+    def _classify_continuation(row: List[str], columns: List[str]) -> Optional[bool]:
+        """
+        Decide locally whether a row continues the previous case.
 
-        if self.verbose:
-            print(f"  No tool call response received")
+        A row is a continuation iff every case-identifying cell (plaintiff,
+        defendant, case name, citation) is blank - the same rule the prompt
+        gives the LLM.
+
+        Returns:
+            True/False, or None if the header has no identifying columns
+        """
+        identity_indices = [
+            i for i, col in enumerate(columns)
+            if any(keyword in col.lower() for keyword in _IDENTITY_COLUMN_KEYWORDS)
+        ]
+        if not identity_indices:
+            return None
+
+        return not any(row[i].strip() for i in identity_indices if i < len(row))
+
+    def _parse_row_locally(
+        self,
+        row: List[str],
+        columns: List[str],
+        is_continuation: Optional[bool]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Try to parse a row without the LLM.
+
+        New-case rows always go to the model: their injuries are only in the
+        narrative Comments column.
+
+        Returns:
+            Parsed row data, or None if the row needs LLM parsing
+        """
+        if is_continuation:
+            return self._parse_continuation_locally(row, columns)
         return None
 
+    @staticmethod
+    def _parse_continuation_locally(row: List[str], columns: List[str]) -> Optional[Dict[str, Any]]:
+        """
+        Build continuation row data without the LLM.
+
+        Only handles rows whose non-empty cells are bare amounts in damages
+        columns; anything with free text (injuries, comments, FLA claims)
+        still needs the model.
+
+        Returns:
+            Parsed row data, or None if the row needs LLM parsing
+        """
+        data: Dict[str, Any] = {'is_continuation': True, 'injuries': []}
+
+        for col, val in zip(columns, row):
+            val = val.strip()
+            if not val:
+                continue
+            if not _AMOUNT_CELL_RE.match(val):
+                return None
+
+            amount = float(val.lstrip('$').replace(',', '').strip())
+            col_lower = col.lower()
+            if 'non-pecuniary' in col_lower or 'non pecuniary' in col_lower or 'general' in col_lower:
+                data['non_pecuniary_damages'] = amount
+            elif 'other' in col_lower or 'pecuniary' in col_lower:
+                data.setdefault('other_damages', []).append({'type': 'other', 'amount': amount})
+            else:
+                return None
+
+        return data
+
+    def _finalize_row_data(
+        self,
+        data: Dict[str, Any],
+        section: str,
+        page_number: int,
+        is_continuation: Optional[bool] = None
+    ) -> Dict[str, Any]:
+        """Attach page/section metadata to parsed row data and normalize the judge."""
+        # Enforce the deterministic continuation rule over the model's answer
+        if is_continuation is not None:
+            data['is_continuation'] = is_continuation
+
+        # Strict tool calls return null for omitted arrays; keep them omitted
+        for key in ('plaintiffs', 'other_damages', 'family_law_act_claims'):
+            if key in data and data[key] is None:
+                del data[key]
+
+        data['source_page'] = page_number
+        data['category'] = section
+        data['region'] = [section] if section else []
+
+        # Normalize judge name to last name only
+        if data.get('judge'):
+            data['judge'] = self.normalize_judge_name(data['judge'])
+
+        # Injuries stay sets while continuation rows merge in; _finalize_case sorts them
+        data['injuries'] = set(data.get('injuries') or [])
+        for plaintiff in data.get('plaintiffs') or []:
+            if isinstance(plaintiff, dict):
+                plaintiff['injuries'] = set(plaintiff.get('injuries') or [])
+
+        return data
+
+    @staticmethod
+    def _finalize_case(case: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a finished case's injury sets to sorted lists for serialization."""
+        case['injuries'] = sorted(case.get('injuries') or [])
+        for plaintiff in case.get('plaintiffs') or []:
+            if isinstance(plaintiff, dict):
+                plaintiff['injuries'] = sorted(plaintiff.get('injuries') or [])
+        return case
+
     def merge_continuation_row(self, case: Dict[str, Any], row_data: Dict[str, Any]) -> None:
         """
         Merge a continuation row into an existing case.
@@ -881,9 +1518,7 @@ CRITICAL RULES:
         """
         # Merge injuries
         if row_data.get('injuries'):
-            existing_injuries = set(case.get('injuries', []))
-            existing_injuries.update(row_data['injuries'])
-            case['injuries'] = list(existing_injuries)
+            case.setdefault('injuries', set()).update(row_data['injuries'])
 
         # Merge other_damages
         if row_data.get('other_damages'):
@@ -914,9 +1549,7 @@ CRITICAL RULES:
 
                     # Merge injuries
                     if new_plaintiff.get('injuries'):
-                        existing_inj = set(existing.get('injuries', []))
-                        existing_inj.update(new_plaintiff['injuries'])
-                        existing['injuries'] = list(existing_inj)
+                        existing.setdefault('injuries', set()).update(new_plaintiff['injuries'])
 
                     # Append comments
                     if new_plaintiff.get('comments'):
@@ -1010,60 +1643,168 @@ CRITICAL RULES:
 
         return cleaned_cases
 
-    def parse_pdf(
+    def _run_camelot_passes(
         self,
         pdf_path: str,
-        start_page: int = 4,
-        end_page: Optional[int] = None,
-        output_json: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
+        page_spec: str
+    ) -> Tuple[Dict[int, Optional[str]], List[Any]]:
         """
-        Parse PDF using Camelot table extraction + LLM row parsing.
+        Run the stream and lattice Camelot passes over the same pages.
 
-        Args:
-            pdf_path: Path to PDF
-            start_page: Starting page (1-indexed, default=4 to skip TOC)
-            end_page: Ending page (None = all)
-            output_json: Optional path to save results
+        With parallel_pages each pass already spreads its pages over every
+        CPU core, so the passes run one after the other. Otherwise they run
+        concurrently: Ghostscript rendering and the native image work release
+        the GIL, so two threads overlap well.
 
         Returns:
-            List of parsed cases
+            Tuple of (section header by page, lattice tables)
         """
-        all_cases = []
-        current_case = None
-        total_rows = 0
-        continuation_rows = 0
+        if self.parallel_pages:
+            sections = self.extract_section_from_stream(pdf_path, page_spec)
+            return sections, self.extract_tables_from_pdf(pdf_path, page_spec)
 
-        # Build page specification for Camelot
-        if end_page is None:
-            page_spec = "all"
-        else:
-            page_spec = f"{start_page}-{end_page}"
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            sections_future = executor.submit(self.extract_section_from_stream, pdf_path, page_spec)
+            tables_future = executor.submit(self.extract_tables_from_pdf, pdf_path, page_spec)
+            return sections_future.result(), tables_future.result()
 
-        if self.verbose:
-            print(f"Parsing pages {page_spec}")
-            print(f"Using Camelot table extraction + LLM row parsing")
-            print(f"Model: {self.model}")
+    def _extract_tables_with_sections(
+        self,
+        pdf_path: str,
+        page_spec: str
+    ) -> Tuple[List[Any], Dict[int, Optional[str]]]:
+        """
+        Run both Camelot passes: stream mode for section headers, lattice mode for tables.
+
+        Args:
+            pdf_path: Path to PDF file
+            page_spec: Page specification (e.g., "1-10" or "all")
 
-        # HYBRID APPROACH: Extract sections using stream mode
+        Returns:
+            Tuple of (lattice tables, section header by page)
+        """
+        # HYBRID APPROACH: stream mode for sections, lattice mode for tables
         if self.verbose:
-            print("\n📄 Extracting section headers with stream mode...")
+            print("\n📄 Extracting section headers (stream) and tables (lattice)...")
 
-        sections_from_stream = self.extract_section_from_stream(pdf_path, page_spec)
+        sections_from_stream, tables = self._run_camelot_passes(pdf_path, page_spec)
 
         if self.verbose:
             found_count = sum(1 for s in sections_from_stream.values() if s)
             print(f"✅ Found {found_count} section headers from stream mode")
+            print(f"✅ Extracted {len(tables)} tables from lattice mode")
 
-        # Extract all tables using lattice mode
-        if self.verbose:
-            print("\n📄 Extracting tables with lattice mode...")
+        return tables, sections_from_stream
 
-        tables = self.extract_tables_from_pdf(pdf_path, page_spec)
+    def _page_chunks(
+        self,
+        pdf_path: str,
+        start_page: int,
+        end_page: Optional[int],
+        pages_per_chunk: int
+    ) -> List[str]:
+        """
+        Split the requested page range into Camelot page specs of pages_per_chunk pages.
 
-        if self.verbose:
-            print(f"✅ Extracted {len(tables)} tables from lattice mode")
+        Args:
+            pdf_path: Path to PDF file
+            start_page: Starting page (1-indexed)
+            end_page: Ending page (None = last page of the PDF)
+            pages_per_chunk: Pages per chunk
 
+        Returns:
+            List of page specs (e.g., ["4-13", "14-23"])
+        """
+        if end_page is None:
+            end_page = len(PdfReader(pdf_path).pages)
+
+        chunks = []
+        for first in range(start_page, end_page + 1, pages_per_chunk):
+            last = min(first + pages_per_chunk - 1, end_page)
+            chunks.append(f"{first}-{last}")
+        return chunks
+
+    def _iter_tables_pipelined(
+        self,
+        pdf_path: str,
+        page_specs: List[str],
+        sections_from_stream: Dict[int, Optional[str]],
+        prefetch_chunks: int = 2
+    ) -> Iterator[Any]:
+        """
+        Yield lattice tables while a producer thread extracts the next page chunks.
+
+        Camelot extraction is CPU/disk-bound and row parsing is network-bound,
+        so extracting chunk N+1 while chunk N's rows are with the LLM hides
+        most of the PDF I/O. Tables are yielded in page order.
+
+        Args:
+            pdf_path: Path to PDF file
+            page_specs: Page chunks from _page_chunks
+            sections_from_stream: Dict filled with section headers by page as
+                chunks are extracted (updated before the chunk's tables are yielded)
+            prefetch_chunks: Max extracted chunks waiting to be parsed
+
+        Yields:
+            Camelot lattice tables
+        """
+        chunk_queue = queue.Queue(maxsize=prefetch_chunks)
+        stop = threading.Event()
+        done = object()
+
+        def put(item: Any) -> bool:
+            while not stop.is_set():
+                try:
+                    chunk_queue.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce() -> None:
+            try:
+                for page_spec in page_specs:
+                    sections, tables = self._run_camelot_passes(pdf_path, page_spec)
+                    if not put((sections, tables, None)):
+                        return
+            except Exception as e:
+                put((None, None, e))
+                return
+            put(done)
+
+        producer = threading.Thread(target=produce, name="camelot-producer", daemon=True)
+        producer.start()
+
+        try:
+            while True:
+                item = chunk_queue.get()
+                if item is done:
+                    break
+                sections, tables, error = item
+                if error is not None:
+                    raise error
+                sections_from_stream.update(sections)
+                yield from tables
+        finally:
+            stop.set()
+            producer.join(timeout=1)
+
+    def _iter_table_rows(
+        self,
+        tables: Iterable[Any],
+        sections_from_stream: Dict[int, Optional[str]]
+    ) -> Iterator[Tuple[int, int, str, List[str], List[List[str]]]]:
+        """
+        Resolve section and header for each table and collect its data rows.
+
+        Args:
+            tables: Camelot lattice tables, in page order (may be a lazy iterator)
+            sections_from_stream: Section header by page from stream mode
+
+        Yields:
+            Tuples of (table_idx, page_number, section, header, data_rows)
+            for every table with recognizable headers
+        """
         # Track current section per page
         section_by_page = {}
 
@@ -1079,13 +1820,15 @@ CRITICAL RULES:
         subsection_keywords = ["GENERAL"]
 
         current_parent_section = None
+        previous_page = None
 
         # Process each table
         for table_idx, table in enumerate(tables):
             page_number = table.page  # Camelot table objects have .page attribute
 
-            if self.verbose and (table_idx == 0 or table.page != tables[table_idx-1].page):
+            if self.verbose and page_number != previous_page:
                 print(f"\nPage {page_number}...", end=" ")
+            previous_page = page_number
 
             # Use section from stream mode, fallback to table detection
             if page_number not in section_by_page:
@@ -1134,8 +1877,11 @@ CRITICAL RULES:
             # Type 2: Newline-separated headers in row 0 - data starts row 1
             # Type 3: Section in row 0, headers in row 1 (pages 21-25) - data starts row 2
 
-            row0_cell0 = str(df.iloc[0, 0]).strip() if len(df) > 0 else ""
-            row0_values = [str(cell).strip() for cell in df.iloc[0].tolist()] if len(df) > 0 else []
+            # Pull the two header candidates out once as plain lists instead of
+            # building a pandas Series per df.iloc[...] access
+            head_rows = [[str(cell).strip() for cell in row] for row in df.head(2).values.tolist()]
+            row0_values = head_rows[0] if head_rows else []
+            row0_cell0 = row0_values[0] if row0_values else ""
             num_filled_cells = sum(1 for v in row0_values if v and v != 'nan')
 
             header = []
@@ -1159,8 +1905,8 @@ CRITICAL RULES:
             else:
                 # Type 3: Section in row 0, headers in row 1 (pages 21-25)
                 if len(df) > 1:
-                    row1_cell0 = str(df.iloc[1, 0]).strip()
-                    row1_values = [str(cell).strip() for cell in df.iloc[1].tolist()]
+                    row1_values = head_rows[1]
+                    row1_cell0 = row1_values[0] if row1_values else ""
                     num_filled_row1 = sum(1 for v in row1_values if v and v != 'nan')
 
                     if self.verbose:
@@ -1187,14 +1933,14 @@ CRITICAL RULES:
                         # Headers spread across row 1
                         header = [v if v and v != 'nan' else f"Col_{i}" for i, v in enumerate(row1_values)]
                     else:
-                        header = [str(h).strip() for h in df.iloc[1].tolist() if str(h).strip()]
+                        header = [h for h in row1_values if h]
 
                     data_start_row = 2
                 else:
                     continue  # Not enough rows
 
             # Validate headers
-            if not header or not any(h.lower() in ['plaintiff', 'case', 'year', 'defendant'] for h in header):
+            if not header or _TABLE_HEADER_KEYWORDS.isdisjoint(h.lower() for h in header):
                 if self.verbose:
                     print(f"SKIP - headers: {header[:5] if header else 'None'}")
                 continue
@@ -1202,57 +1948,68 @@ CRITICAL RULES:
             if self.verbose:
                 print(f"Headers: {header[:5] if len(header) > 5 else header}, data_start: {data_start_row}, df_len: {len(df)}")
 
-            page_rows = 0
-            page_new = 0
-            page_merged = 0
-
-            # Process data rows starting from correct row
-            for idx in range(data_start_row, len(df)):
-                row = df.iloc[idx]
-                row_cells = [str(cell).strip() if cell else "" for cell in row]
-
-                # Skip empty rows
-                if not any(row_cells):
+            # Collect data rows starting from correct row
+            # (plain tuples - df.iloc[idx] builds a pandas Series per row)
+            pending_rows = []
+            for row in df.iloc[data_start_row:].itertuples(index=False, name=None):
+                # Skip empty/padding rows before building the cleaned row
+                if not any(cell and not str(cell).isspace() for cell in row):
                     continue
 
-                page_rows += 1
-                total_rows += 1
+                pending_rows.append([str(cell).strip() if cell else "" for cell in row])
 
-                # Parse row with LLM
-                row_data = self.parse_row(row_cells, header, section, page_number)
+            yield table_idx, page_number, section, header, pending_rows
 
-                if not row_data:
-                    continue
+    def _merge_parsed_rows(
+        self,
+        parsed_rows: List[Optional[Dict[str, Any]]],
+        all_cases: List[Dict[str, Any]],
+        current_case: Optional[Dict[str, Any]]
+    ) -> Tuple[Optional[Dict[str, Any]], int, int]:
+        """
+        Apply parsed rows, in order, to the running case state.
 
-                # Check if continuation row
-                if row_data.get('is_continuation') and current_case:
-                    # Merge into current case
-                    self.merge_continuation_row(current_case, row_data)
-                    page_merged += 1
-                    continuation_rows += 1
-                else:
-                    # New case
-                    if current_case:
-                        all_cases.append(current_case)
+        Continuation rows are merged into the current case; any other row
+        finalizes the current case into all_cases and becomes the new one.
 
-                    current_case = row_data
-                    page_new += 1
+        Args:
+            parsed_rows: Parsed rows in original table order (None = failed)
+            all_cases: Finalized cases (appended to in place)
+            current_case: Case currently accepting continuation rows
+
+        Returns:
+            Tuple of (current_case, new_count, merged_count)
+        """
+        new_count = 0
+        merged_count = 0
 
-            if self.verbose and page_rows > 0:
-                print(f"{page_rows} rows, {page_new} new, {page_merged} merged")
+        for row_data in parsed_rows:
+            if not row_data:
+                continue
 
-            # Save incremental results every 10 tables
-            if output_json and table_idx > 0 and table_idx % 10 == 0:
+            # Check if continuation row
+            if row_data.get('is_continuation') and current_case:
+                # Merge into current case
+                self.merge_continuation_row(current_case, row_data)
+                merged_count += 1
+            else:
+                # New case
                 if current_case:
-                    all_cases.append(current_case)
-                    current_case = None
-                with open(output_json, 'w') as f:
-                    json.dump(all_cases, f, indent=2)
+                    all_cases.append(self._finalize_case(current_case))
 
-        # Add final case
-        if current_case:
-            all_cases.append(current_case)
+                current_case = row_data
+                new_count += 1
 
+        return current_case, new_count, merged_count
+
+    def _finish_parse(
+        self,
+        all_cases: List[Dict[str, Any]],
+        total_rows: int,
+        continuation_rows: int,
+        output_json: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """Print the summary, clean up plaintiff data and save final results."""
         if self.verbose:
             print(f"\n✓ Parsing complete")
             print(f"  Total rows processed: {total_rows}")
@@ -1267,11 +2024,309 @@ CRITICAL RULES:
 
         # Save final results
         if output_json:
-            with open(output_json, 'w') as f:
-                json.dump(all_cases, f, indent=2)
+            _write_json(all_cases, output_json)
 
         return all_cases
 
+    def parse_pdf(
+        self,
+        pdf_path: str,
+        start_page: int = 4,
+        end_page: Optional[int] = None,
+        output_json: Optional[str] = None,
+        pages_per_chunk: int = 10
+    ) -> List[Dict[str, Any]]:
+        """
+        Parse PDF using Camelot table extraction + LLM row parsing.
+
+        Pages are extracted in chunks by a background thread, so Camelot
+        works on the next chunk while the current one is being parsed.
+        Finalized cases are appended to output_json + '.jsonl' as parsing
+        progresses, so an interrupted run keeps everything parsed so far.
+
+        Args:
+            pdf_path: Path to PDF
+            start_page: Starting page (1-indexed, default=4 to skip TOC)
+            end_page: Ending page (None = all)
+            output_json: Optional path to save results
+            pages_per_chunk: Pages extracted per Camelot call
+
+        Returns:
+            List of parsed cases
+        """
+        all_cases = []
+        current_case = None
+        total_rows = 0
+        continuation_rows = 0
+        checkpointed = 0
+
+        # Build page chunks for Camelot
+        page_specs = self._page_chunks(pdf_path, start_page, end_page, pages_per_chunk)
+
+        if self.verbose:
+            print(f"Parsing pages {start_page}-{end_page or 'end'} "
+                  f"({len(page_specs)} chunks of {pages_per_chunk} pages)")
+            print(f"Using Camelot table extraction + LLM row parsing")
+            print(f"Model: {self.model}")
+
+        sections_from_stream = {}
+        tables = self._iter_tables_pipelined(pdf_path, page_specs, sections_from_stream)
+
+        # Append-only checkpoint of finalized cases (O(cases) total writes)
+        checkpoint = open(f"{output_json}.jsonl", 'wb') if output_json else None
+
+        try:
+            for table_idx, page_number, section, header, pending_rows in self._iter_table_rows(tables, sections_from_stream):
+                page_rows = len(pending_rows)
+                total_rows += page_rows
+
+                # Parse rows with LLM concurrently (network-bound), then merge in
+                # original row order so continuation handling stays deterministic
+                row_batches = [
+                    pending_rows[i:i + self.rows_per_request]
+                    for i in range(0, len(pending_rows), self.rows_per_request)
+                ]
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    futures = [
+                        executor.submit(self.parse_rows_batch, batch, header, section, page_number)
+                        for batch in row_batches
+                    ]
+                    parsed_rows = [row_data for future in futures for row_data in future.result()]
+
+                current_case, page_new, page_merged = self._merge_parsed_rows(parsed_rows, all_cases, current_case)
+                continuation_rows += page_merged
+
+                if self.verbose and page_rows > 0:
+                    print(f"{page_rows} rows, {page_new} new, {page_merged} merged")
+
+                # Checkpoint cases finalized by this table
+                if checkpoint:
+                    for case in all_cases[checkpointed:]:
+                        checkpoint.write(_dumps_json_line(case))
+                    checkpoint.flush()
+                    checkpointed = len(all_cases)
+
+            # Add final case
+            if current_case:
+                all_cases.append(self._finalize_case(current_case))
+                if checkpoint:
+                    checkpoint.write(_dumps_json_line(current_case))
+        finally:
+            tables.close()
+            if checkpoint:
+                checkpoint.close()
+
+        return self._finish_parse(all_cases, total_rows, continuation_rows, output_json)
+
+    def parse_pdf_batch(
+        self,
+        pdf_path: str,
+        start_page: int = 4,
+        end_page: Optional[int] = None,
+        output_json: Optional[str] = None,
+        batch_api_version: str = "2024-10-21",
+        poll_interval: float = 60.0
+    ) -> List[Dict[str, Any]]:
+        """
+        Parse PDF using the Azure OpenAI Batch API instead of per-row calls.
+
+        All row prompts are collected up front, submitted as one JSONL batch
+        job (roughly half the per-token cost of synchronous calls, no rate
+        limiting), and merged in original row order once the job completes.
+        Suited to offline full-compendium runs; results may take up to 24h.
+
+        Requires a Global Batch deployment of the model. Cached responses
+        are reused and new results are written back to the cache.
+
+        Args:
+            pdf_path: Path to PDF
+            start_page: Starting page (1-indexed, default=4 to skip TOC)
+            end_page: Ending page (None = all)
+            output_json: Optional path to save results
+            batch_api_version: Azure API version supporting the Batch API
+            poll_interval: Seconds between batch status checks
+
+        Returns:
+            List of parsed cases
+        """
+        if self.is_claude:
+            raise ValueError("Batch parsing is only supported for Azure OpenAI deployments")
+
+        # Camelot page spec; honour start_page (skips the TOC) even without an end page
+        if end_page is None:
+            page_spec = f"{start_page}-end"
+        else:
+            page_spec = f"{start_page}-{end_page}"
+
+        if self.verbose:
+            print(f"Parsing pages {page_spec}")
+            print(f"Using Camelot table extraction + Batch API row parsing")
+            print(f"Model: {self.model}")
+
+        tables, sections_from_stream = self._extract_tables_with_sections(pdf_path, page_spec)
+
+        # Phase 1: build one request per row, reusing cached responses
+        table_rows = []
+        batch_requests = []
+        results: Dict[str, Dict[str, Any]] = {}
+        cache_keys: Dict[str, str] = {}
+
+        for table_idx, page_number, section, header, pending_rows in self._iter_table_rows(tables, sections_from_stream):
+            custom_ids = []
+            for row_idx, row_cells in enumerate(pending_rows):
+                row_prompt = self._build_row_prompt(row_cells, header, section)
+                if row_prompt is None:
+                    continue
+                system, prompt = row_prompt
+
+                custom_id = f"t{table_idx}_r{row_idx}"
+                is_continuation = self._classify_continuation(row_cells, header)
+                custom_ids.append((custom_id, is_continuation))
+
+                local_data = self._parse_row_locally(row_cells, header, is_continuation)
+                if local_data is not None:
+                    results[custom_id] = local_data
+                    continue
+
+                cache_key = ResponseCache.make_key(self.model, self._cache_text(prompt, system))
+                cached = self.cache.get(cache_key) if self.cache else None
+                if cached is not None:
+                    results[custom_id] = cached["tool_call"]
+                    continue
+
+                cache_keys[custom_id] = cache_key
+                batch_requests.append({
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": "/chat/completions",
+                    "body": {"model": self.model, **self._build_payload(prompt, system=system)}
+                })
+
+            table_rows.append((page_number, section, custom_ids))
+
+        if self.verbose:
+            print(f"\n📦 {len(batch_requests)} rows to submit, {len(results)} served from cache")
+
+        # Phase 2: submit batch job and wait for results
+        if batch_requests:
+            batch_results = self._run_batch(batch_requests, batch_api_version, poll_interval)
+            for custom_id, tool_args in batch_results.items():
+                results[custom_id] = tool_args
+                if self.cache and custom_id in cache_keys:
+                    self.cache.set(cache_keys[custom_id], {"tool_call": tool_args})
+
+        # Phase 3: merge rows in original order
+        all_cases = []
+        current_case = None
+        total_rows = 0
+        continuation_rows = 0
+
+        for page_number, section, custom_ids in table_rows:
+            total_rows += len(custom_ids)
+            parsed_rows = [
+                self._finalize_row_data(results[custom_id], section, page_number, is_continuation)
+                if custom_id in results else None
+                for custom_id, is_continuation in custom_ids
+            ]
+            current_case, _, page_merged = self._merge_parsed_rows(parsed_rows, all_cases, current_case)
+            continuation_rows += page_merged
+
+        # Add final case
+        if current_case:
+            all_cases.append(self._finalize_case(current_case))
+
+        return self._finish_parse(all_cases, total_rows, continuation_rows, output_json)
+
+    def _run_batch(
+        self,
+        batch_requests: List[Dict[str, Any]],
+        api_version: str,
+        poll_interval: float
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Upload batch requests, wait for the job, and collect tool-call results.
+
+        Args:
+            batch_requests: Batch API request lines (with custom_id)
+            api_version: Azure API version supporting the Batch API
+            poll_interval: Seconds between status checks
+
+        Returns:
+            Dict mapping custom_id to parsed tool-call arguments
+        """
+        base_url = f"{self.endpoint}/openai"
+        params = {"api-version": api_version}
+        jsonl = "\n".join(json.dumps(line) for line in batch_requests).encode('utf-8')
+
+        # Multipart upload - drop the session's JSON content type for this request
+        upload = self.session.post(
+            f"{base_url}/files",
+            params=params,
+            data={"purpose": "batch"},
+            files={"file": ("rows.jsonl", jsonl, "application/jsonl")},
+            headers={"Content-Type": None},
+            timeout=(5, 300)
+        )
+        upload.raise_for_status()
+        input_file_id = upload.json()["id"]
+
+        created = self.session.post(
+            f"{base_url}/batches",
+            params=params,
+            json={
+                "input_file_id": input_file_id,
+                "endpoint": "/chat/completions",
+                "completion_window": "24h"
+            },
+            timeout=(5, 60)
+        )
+        created.raise_for_status()
+        batch_id = created.json()["id"]
+
+        if self.verbose:
+            print(f"  Submitted batch {batch_id}")
+
+        while True:
+            status_response = self.session.get(f"{base_url}/batches/{batch_id}", params=params, timeout=(5, 60))
+            status_response.raise_for_status()
+            batch = status_response.json()
+            status = batch.get("status")
+
+            if status == "completed":
+                break
+            if status in ("failed", "expired", "cancelled"):
+                raise RuntimeError(f"Batch {batch_id} ended with status '{status}'")
+
+            if self.verbose:
+                counts = batch.get("request_counts") or {}
+                print(f"  Batch {status}: {counts.get('completed', 0)}/{counts.get('total', len(batch_requests))} rows")
+            time.sleep(poll_interval)
+
+        results = {}
+        output_file_id = batch.get("output_file_id")
+        if not output_file_id:
+            return results
+
+        content = self.session.get(f"{base_url}/files/{output_file_id}/content", params=params, timeout=(5, 300))
+        content.raise_for_status()
+
+        for line in content.text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") != 200:
+                self.errors.append({"custom_id": record.get("custom_id"), "error": record.get("error") or response})
+                continue
+            tool_args = self._extract_tool_call(response.get("body") or {})
+            if tool_args is not None:
+                results[record["custom_id"]] = tool_args
+
+        if self.verbose:
+            print(f"  Batch complete: {len(results)}/{len(batch_requests)} rows parsed")
+
+        return results
+
     def detect_section_from_table(self, table) -> str:
         """
         Detect body region section from table content.
@@ -1294,7 +2349,11 @@ def parse_compendium_tables(
     start_page: Optional[int] = None,
     end_page: Optional[int] = None,
     verbose: bool = True,
-    requests_per_minute: int = 200
+    requests_per_minute: int = 200,
+    max_workers: int = 8,
+    cache_path: Optional[str] = ".damages_cache.sqlite",
+    use_batch: bool = False,
+    rows_per_request: int = 10
 ) -> List[Dict[str, Any]]:
     """
     Parse Ontario Damages Compendium using hybrid Camelot + LLM approach.
@@ -1317,6 +2376,10 @@ def parse_compendium_tables(
         end_page: Ending page
         verbose: Print progress
         requests_per_minute: Rate limit
+        max_workers: Number of rows parsed concurrently per table
+        cache_path: SQLite file for cached responses (None disables caching)
+        use_batch: Submit all rows as one Azure Batch API job (cheaper, slower)
+        rows_per_request: Rows sent together in one LLM prompt (1 = per-row)
 
     Returns:
         List of parsed cases
@@ -1334,20 +2397,23 @@ def parse_compendium_tables(
     if verbose and rate_limiter:
         print(f"Rate limiting: {requests_per_minute} requests/minute")
 
-    parser = TableBasedParser(
+    with TableBasedParser(
         endpoint=endpoint,
         api_key=api_key,
         model=model,
         verbose=verbose,
-        rate_limiter=rate_limiter
-    )
-
-    return parser.parse_pdf(
-        pdf_path=pdf_path,
-        start_page=start_page or 4,  # Start on page 4 to skip TOC (pages 1-3)
-        end_page=end_page,
-        output_json=output_json
-    )
+        rate_limiter=rate_limiter,
+        max_workers=max_workers,
+        cache_path=cache_path,
+        rows_per_request=rows_per_request
+    ) as parser:
+        parse = parser.parse_pdf_batch if use_batch else parser.parse_pdf
+        return parse(
+            pdf_path=pdf_path,
+            start_page=start_page or 4,  # Start on page 4 to skip TOC (pages 1-3)
+            end_page=end_page,
+            output_json=output_json
+        )
 
 
 if __name__ == "__main__":
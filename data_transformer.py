@@ -5,9 +5,167 @@ Consolidates duplicate cases and keeps plaintiffs/regions as attributes.
 """
 
 import json
-from typing import List, Dict, Any
+import pickle
+import hashlib
+from operator import itemgetter
+from typing import List, Dict, Any, Optional, Tuple, Union
 from pathlib import Path
-from collections import defaultdict
+
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+def embeddings_sidecar_path(json_path: Union[str, Path]) -> Path:
+    """
+    Get the .npy sidecar path holding embeddings for a dashboard JSON file.
+
+    Example: data/damages_with_embeddings.json -> data/damages_with_embeddings.embeddings.npy
+    """
+    json_path = Path(json_path)
+    return json_path.with_name(f"{json_path.stem}.embeddings.npy")
+
+
+def save_embeddings_sidecar(
+    dashboard_cases: List[Dict[str, Any]],
+    json_path: Union[str, Path]
+) -> Path:
+    """
+    Move case embeddings out of the JSON into a float16 .npy matrix.
+
+    Each case's 'embedding' list is removed and replaced with 'embedding_idx',
+    its row in the saved (N, D) matrix. Cases are modified in place.
+
+    Args:
+        dashboard_cases: Cases from convert_to_dashboard_format
+        json_path: Path the dashboard JSON will be written to
+
+    Returns:
+        Path to the saved .npy sidecar
+    """
+    # Fill a preallocated matrix row by row instead of stacking a list of lists
+    dim = len(dashboard_cases[0]['embedding']) if dashboard_cases else 0
+    embeddings = np.empty((len(dashboard_cases), dim), dtype=np.float16)
+    for idx, case in enumerate(dashboard_cases):
+        embeddings[idx] = case.pop('embedding')
+        case['embedding_idx'] = idx
+
+    sidecar_path = embeddings_sidecar_path(json_path)
+    np.save(sidecar_path, embeddings)
+    return sidecar_path
+
+
+def load_embeddings_sidecar(json_path: Union[str, Path]) -> np.ndarray:
+    """
+    Memory-map the embeddings sidecar for a dashboard JSON file.
+
+    Rows are indexed by each case's 'embedding_idx'.
+    """
+    return np.load(embeddings_sidecar_path(json_path), mmap_mode='r')
+
+
+def quantize_embeddings_int8(embeddings: np.ndarray) -> np.ndarray:
+    """
+    Quantize an embedding matrix to int8 for cosine search.
+
+    Rows are L2-normalized, then the whole matrix is scaled by one factor so
+    its largest component maps to 127. Cosine similarity ignores row scale,
+    so no scale needs to be stored: readers cast to float32 and renormalize.
+
+    Args:
+        embeddings: (N, D) float matrix
+
+    Returns:
+        (N, D) int8 matrix (a quarter of float32's size)
+    """
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    unit = embeddings / norms
+    max_abs = float(np.abs(unit).max()) if unit.size else 0.0
+    scale = 127.0 / max_abs if max_abs else 1.0
+    return np.clip(np.rint(unit * scale), -127, 127).astype(np.int8)
+
+
+# Summary for cases with no injuries, categories or comments
+NO_SUMMARY_TEXT = 'No summary available'
+
+# Comment characters kept in the text embedded for each case (~100 tokens)
+EMBED_MAX_COMMENT_CHARS = 400
+
+
+def summary_text_key(summary_text: str, encoder_signature: str = '') -> str:
+    """Embedding cache key for a summary text under an encoder (SHA-1 of both)."""
+    return hashlib.sha1(f"{encoder_signature}\x00{summary_text}".encode('utf-8')).hexdigest()
+
+
+def embedding_encoder_signature(model, max_seq_length: Optional[int] = None) -> str:
+    """
+    Describe the encoder settings an embedding depends on.
+
+    Combines the model name, the effective token limit and the weight dtype
+    (e.g. float16 on CUDA), so changing any of them misses the cache.
+    """
+    name = getattr(getattr(model, 'model_card_data', None), 'base_model', None)
+    if not name:
+        try:
+            name = model[0].auto_model.config._name_or_path
+        except Exception:
+            name = type(model).__name__
+
+    model_max = getattr(model, 'max_seq_length', None)
+    seq_length = min(max_seq_length, model_max) if max_seq_length and model_max else model_max
+
+    try:
+        dtype = str(next(model.parameters()).dtype)
+    except Exception:
+        dtype = 'unknown'
+
+    return f"{name}|{seq_length}|{dtype}"
+
+
+def load_embedding_cache(cache_path: Union[str, Path]) -> Dict[str, np.ndarray]:
+    """
+    Load the persistent summary-text embedding cache.
+
+    Returns:
+        Dict mapping summary_text_key -> embedding (empty if no cache yet)
+    """
+    cache_path = Path(cache_path)
+    if not cache_path.exists():
+        return {}
+    try:
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+    except Exception as e:
+        print(f"⚠️  Warning: Could not read embedding cache {cache_path}: {e}")
+        return {}
+
+
+def save_embedding_cache(cache: Dict[str, np.ndarray], cache_path: Union[str, Path]) -> None:
+    """Save the summary-text embedding cache."""
+    cache_path = Path(cache_path)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(cache_path, 'wb') as f:
+        pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _as_list(value: Any) -> List[Any]:
+    """Normalize a list-or-scalar field: lists pass through, falsy -> [], scalar -> [value]."""
+    if isinstance(value, list):
+        return value
+    return [value] if value else []
 
 
 def consolidate_cases(ai_cases: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -23,8 +181,9 @@ def consolidate_cases(ai_cases: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     Returns:
         List of consolidated unique cases
     """
-    # Group cases by unique identifier
-    case_groups = defaultdict(list)
+    # Group cases by unique identifier, accumulating each group's plaintiffs,
+    # regions, categories and injuries in the same pass
+    case_groups = {}
 
     for case in ai_cases:
         # Create unique key (case_name + year + court)
@@ -33,57 +192,56 @@ def consolidate_cases(ai_cases: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
             case.get('year'),
             case.get('court')
         )
-        case_groups[key].append(case)
+        group = case_groups.get(key)
+        if group is None:
+            # Use first case as base
+            group = case_groups[key] = {
+                'base_case': case,
+                'plaintiffs': [],
+                'seen_plaintiff_ids': set(),
+                'regions': set(),
+                'categories': set(),
+                'injuries': set()
+            }
 
-    consolidated = []
+        # Collect all unique plaintiffs (and their injuries)
+        all_plaintiffs = group['plaintiffs']
+        plaintiffs = case.get('plaintiffs', [])
+        if not plaintiffs:
+            # Single plaintiff case
+            plaintiffs = [case]
 
-    for (case_name, year, court), cases in case_groups.items():
-        # Use first case as base
-        base_case = cases[0]
+        for p in plaintiffs:
+            p_id = p.get('plaintiff_id') or f"P{len(all_plaintiffs)+1}"
+            if p_id not in group['seen_plaintiff_ids']:
+                group['seen_plaintiff_ids'].add(p_id)
+                all_plaintiffs.append(p)
+                injuries = p.get('injuries', [])
+                if isinstance(injuries, list):
+                    group['injuries'].update(injuries)
 
-        # Collect all unique plaintiffs
-        all_plaintiffs = []
-        seen_plaintiff_ids = set()
+        # Collect all unique regions/categories
+        cat = case.get('category')
+        if cat and cat != 'UNKNOWN':
+            group['categories'].add(cat)
 
-        for case in cases:
-            plaintiffs = case.get('plaintiffs', [])
-            if not plaintiffs:
-                # Single plaintiff case
-                plaintiffs = [case]
+        group['regions'].update(
+            r for r in _as_list(case.get('region')) if r and r != 'UNKNOWN'
+        )
 
-            for p in plaintiffs:
-                p_id = p.get('plaintiff_id') or f"P{len(all_plaintiffs)+1}"
-                if p_id not in seen_plaintiff_ids:
-                    seen_plaintiff_ids.add(p_id)
-                    all_plaintiffs.append(p)
+        # Also check case-level injuries
+        injuries = case.get('injuries', [])
+        if isinstance(injuries, list):
+            group['injuries'].update(injuries)
 
-        # Collect all unique regions/categories
-        all_regions = set()
-        all_categories = set()
-
-        for case in cases:
-            cat = case.get('category')
-            if cat and cat != 'UNKNOWN':
-                all_categories.add(cat)
-
-            regions = case.get('region', [])
-            if isinstance(regions, list):
-                all_regions.update(r for r in regions if r and r != 'UNKNOWN')
-            elif regions and regions != 'UNKNOWN':
-                all_regions.add(regions)
-
-        # Collect all injuries from all plaintiffs
-        all_injuries = set()
-        for p in all_plaintiffs:
-            injuries = p.get('injuries', [])
-            if isinstance(injuries, list):
-                all_injuries.update(injuries)
+    consolidated = []
 
-        # Also check case-level injuries
-        for case in cases:
-            injuries = case.get('injuries', [])
-            if isinstance(injuries, list):
-                all_injuries.update(injuries)
+    for (case_name, year, court), group in case_groups.items():
+        base_case = group['base_case']
+        all_plaintiffs = group['plaintiffs']
+        all_regions = group['regions']
+        all_categories = group['categories']
+        all_injuries = group['injuries']
 
         # Build consolidated case
         consolidated_case = {
@@ -106,21 +264,283 @@ def consolidate_cases(ai_cases: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     return consolidated
 
 
+def _dumps_json(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes (compact unless indent)."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def read_json(path: Union[str, Path]) -> Any:
+    """Load a JSON file (with orjson when installed)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_dashboard_json(data: Any, path: Union[str, Path]) -> None:
+    """
+    Write data files read by the app as compact UTF-8 JSON.
+
+    Pretty-printing roughly doubles size and dump time; use `jq .` to read them.
+    Lists are written one item at a time, so the whole file is never held
+    in memory as one serialized buffer.
+    """
+    if not isinstance(data, list):
+        Path(path).write_bytes(_dumps_json(data))
+        return
+
+    with open(path, 'wb') as f:
+        f.write(b'[')
+        for idx, item in enumerate(data):
+            if idx:
+                f.write(b',')
+            f.write(_dumps_json(item))
+        f.write(b']')
+
+
+def _arrow_column(values: List[Any]) -> Tuple["pa.Array", bool]:
+    """
+    Build an Arrow column, falling back to JSON strings for mixed-type fields.
+
+    Parsed fields such as judge or source_page can be a scalar in one case and
+    a list in another, which Arrow cannot infer a single type for.
+
+    Returns:
+        (array, True if the values were stored as JSON strings)
+    """
+    try:
+        return pa.array(values), False
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pa.array(
+            [None if v is None else _dumps_json(v).decode('utf-8') for v in values],
+            type=pa.string()
+        ), True
+
+
+def write_dashboard_parquet(
+    dashboard_cases: List[Dict[str, Any]],
+    path: Union[str, Path],
+    embeddings: Optional[np.ndarray] = None
+) -> Path:
+    """
+    Write dashboard cases to a zstd-compressed Parquet file for analytics.
+
+    Nested fields (plaintiffs, extended_data) become Arrow list/struct columns,
+    so readers can load just the columns they need. Mixed-type fields are
+    stored as JSON strings and listed in the 'json_columns' schema metadata.
+
+    Args:
+        dashboard_cases: Cases from convert_to_dashboard_format
+        path: Output .parquet path
+        embeddings: Optional (N, D) matrix stored as a fixed-size float16
+            list column named 'embedding'
+
+    Returns:
+        Path to the written file
+    """
+    if not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow is required for Parquet output (pip install pyarrow)")
+
+    columns = list(dict.fromkeys(key for case in dashboard_cases for key in case))
+    arrays, json_columns = [], []
+    for name in columns:
+        array, as_json = _arrow_column([case.get(name) for case in dashboard_cases])
+        if as_json:
+            json_columns.append(name)
+        arrays.append(array)
+
+    if embeddings is not None:
+        embeddings = np.ascontiguousarray(embeddings, dtype=np.float16)
+        arrays.append(pa.FixedSizeListArray.from_arrays(
+            pa.array(embeddings.ravel(), type=pa.float16()), embeddings.shape[1]
+        ))
+        columns.append('embedding')
+
+    table = pa.Table.from_arrays(arrays, names=columns).replace_schema_metadata(
+        {'json_columns': json.dumps(json_columns)}
+    )
+    pq.write_table(table, str(path), compression='zstd')
+    return Path(path)
+
+
+def read_dashboard_parquet(
+    path: Union[str, Path],
+    columns: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Read cases written by write_dashboard_parquet back into dicts.
+
+    Args:
+        path: .parquet path
+        columns: Optional subset of columns to load
+
+    Returns:
+        List of case dictionaries (struct fields missing from a case come back as None)
+    """
+    if not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow is required for Parquet input (pip install pyarrow)")
+
+    table = pq.read_table(str(path), columns=columns)
+    metadata = table.schema.metadata or {}
+    json_columns = json.loads(metadata.get(b'json_columns', b'[]'))
+
+    cases = table.to_pylist()
+    for name in json_columns:
+        if name in table.column_names:
+            for case in cases:
+                if case[name] is not None:
+                    case[name] = json.loads(case[name])
+    return cases
+
+
+# Fields copied from a parsed case into a dashboard case, with the value used
+# when the parser left them out. Lists are filled in per case so dashboard
+# cases never share a mutable default.
+_CASE_DEFAULTS = {
+    'case_name': 'Unknown',
+    'year': None,
+    'court': None,
+    'judge': None,
+    'citation': None,
+    'source_page': None,
+    'category': 'UNKNOWN',
+    'non_pecuniary_damages': None,
+    'pecuniary_damages': None,
+    'total_award': None,
+    'comments': None,
+    'sex': None,
+    'age': None,
+    'plaintiffs': None,
+}
+_get_case_fields = itemgetter(
+    'case_name', 'year', 'court', 'judge', 'citation', 'source_page',
+    'category', 'non_pecuniary_damages', 'pecuniary_damages', 'total_award',
+    'comments', 'injuries', 'sex', 'age', 'other_damages', 'plaintiffs'
+)
+
+
+def add_embeddings_to_cases(
+    input_json: str,
+    output_json: str,
+    return_cases: bool = True,
+    pretty: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Transform parsed cases to dashboard format.
+
+    Each case is written as soon as it is built. A .jsonl output_json gets
+    one case per line (NDJSON); anything else gets a JSON array.
+
+    Args:
+        input_json: Path to raw parsed cases (from damages_parser_table.py)
+        output_json: Path to save dashboard-ready cases
+        return_cases: Keep and return the cases (False keeps memory flat
+            and returns an empty list)
+        pretty: Indent JSON array records for human reading (default compact)
+
+    Returns:
+        List of dashboard-ready cases
+    """
+    # Load raw parsed cases
+    raw_cases = read_json(input_json)
+
+    dashboard_cases = []
+    ndjson = str(output_json).endswith('.jsonl')
+    count = 0
+
+    with open(output_json, 'wb') as out:
+        if not ndjson:
+            out.write(b'[\n')
+
+        for idx, case in enumerate(raw_cases):
+            # Transform to dashboard format (one C-level lookup for all fields)
+            (case_name, year, court, judge, citation, source_page, category,
+             non_pecuniary, pecuniary, total_award, comments, injuries, sex,
+             age, other_damages, plaintiffs) = _get_case_fields(
+                {**_CASE_DEFAULTS, 'injuries': [], 'other_damages': [], **case}
+            )
+            dashboard_case = {
+                'id': f"case_{idx + 1:04d}",
+                'case_name': case_name,
+                'year': year,
+                'court': court,
+                'judge': judge,
+                'citation': citation,
+                'source_page': source_page,
+                'category': category,
+                'non_pecuniary_damages': non_pecuniary,
+                'pecuniary_damages': pecuniary,
+                'total_award': total_award,
+                'comments': comments,
+                'extended_data': {
+                    'injuries': injuries,
+                    'regions': [category],  # Use category as region
+                    'sex': sex,
+                    'age': age,
+                    'other_damages': other_damages
+                }
+            }
+
+            # Handle multi-plaintiff cases
+            if plaintiffs:
+                dashboard_case['plaintiffs'] = plaintiffs
+
+            # Save dashboard case (orjson always writes UTF-8, like ensure_ascii=False)
+            if ndjson:
+                out.write(_dumps_json(dashboard_case) + b'\n')
+            else:
+                if count:
+                    out.write(b',\n')
+                out.write(_dumps_json(dashboard_case, indent=pretty))
+            count += 1
+
+            if return_cases:
+                dashboard_cases.append(dashboard_case)
+
+        if not ndjson:
+            out.write(b'\n]\n')
+
+    print(f"✅ Transformed {count} cases")
+    print(f"   Saved to: {output_json}")
+
+    return dashboard_cases
+
+
 def convert_to_dashboard_format(
     ai_cases: List[Dict[str, Any]],
-    model
+    model,
+    batch_size: int = 64,
+    cache_path: Optional[Union[str, Path]] = None,
+    max_seq_length: Optional[int] = 128
 ) -> List[Dict[str, Any]]:
     """
     Convert AI-parsed format to dashboard format with embeddings.
 
     FIXED: Consolidates duplicate cases and keeps plaintiffs as nested data.
 
+    Summary texts are built for every case first and then encoded in a
+    single batched model.encode call; identical summaries are encoded once.
+    With cache_path, embeddings are cached by summary text across runs and
+    only new texts are encoded.
+
     Args:
         ai_cases: List of cases in AI-parsed format
         model: SentenceTransformer model for generating embeddings
+        batch_size: Number of summaries encoded per forward pass
+        cache_path: Optional pickle file caching embeddings by summary text
+            and encoder settings; entries unused by this run are dropped
+        max_seq_length: Token limit while encoding summaries (None = model default)
 
     Returns:
-        List of cases in dashboard format with embeddings
+        List of cases in dashboard format with embeddings (each an immutable
+        tuple, shared between cases with the same summary)
     """
     # First, consolidate duplicate cases
     print("   🔄 Consolidating duplicate cases...")
@@ -128,22 +548,28 @@ def convert_to_dashboard_format(
     print(f"   ✓ Consolidated {len(ai_cases)} records → {len(consolidated_cases)} unique cases")
 
     dashboard_cases = []
+    embed_texts = []
 
     for case_idx, case in enumerate(consolidated_cases, 1):
-        plaintiffs = case.get('plaintiffs', [])
+        # Read each field once (several are used by both the case and its summary)
+        cg = case.get
+        plaintiffs = cg('plaintiffs', [])
+        injuries = cg('injuries', [])
+        comments = cg('comments', '')
+        primary_plaintiff = plaintiffs[0] if plaintiffs else None
 
         # Get citation (handle list)
-        citation = case.get('citation', [])
+        citation = cg('citation', [])
         if isinstance(citation, list):
             citation = '; '.join(str(c) for c in citation if c)
 
         # Get judges (handle list)
-        judges = case.get('judge', [])
+        judges = cg('judge', [])
         if not isinstance(judges, list):
             judges = [judges] if judges else []
 
         # Get source page (use first if list)
-        source_page = case.get('source_page')
+        source_page = cg('source_page')
         if isinstance(source_page, list):
             source_page = source_page[0] if source_page else None
 
@@ -157,7 +583,7 @@ def convert_to_dashboard_format(
         # Calculate total pecuniary damages from other_damages array
         # Pecuniary = economic damages (lost income, care costs, etc.)
         total_pecuniary = 0
-        other_damages_list = case.get('other_damages', [])
+        other_damages_list = cg('other_damages', [])
 
         for damage in other_damages_list:
             amount = damage.get('amount', 0)
@@ -167,17 +593,17 @@ def convert_to_dashboard_format(
         total_award = total_non_pecuniary + total_pecuniary if (total_non_pecuniary or total_pecuniary) else None
 
         # Get primary category and region
-        categories = case.get('categories', ['UNKNOWN'])
-        regions = case.get('regions', ['UNKNOWN'])
+        categories = cg('categories', ['UNKNOWN'])
+        regions = cg('regions', ['UNKNOWN'])
         primary_category = categories[0] if categories else 'UNKNOWN'
         primary_region = regions[0] if regions else 'UNKNOWN'
 
         # Create dashboard case
         dashboard_case = {
             'id': f"case_{case_idx:04d}",
-            'case_name': case.get('case_name', 'Unknown'),
-            'year': case.get('year'),
-            'court': case.get('court'),
+            'case_name': cg('case_name', 'Unknown'),
+            'year': cg('year'),
+            'court': cg('court'),
             'judge': judges,
             'citation': citation,
             'source_page': source_page,
@@ -187,44 +613,99 @@ def convert_to_dashboard_format(
             'non_pecuniary_damages': total_non_pecuniary,  # General damages (pain & suffering)
             'pecuniary_damages': total_pecuniary,  # Economic damages (lost income, care costs)
             'total_award': total_award,  # Total of both non-pecuniary + pecuniary
-            'comments': case.get('comments', ''),
+            'comments': comments,
             'extended_data': {
-                'injuries': case.get('injuries', []),
+                'injuries': injuries,
                 'regions': regions,  # ALL regions
                 'categories': categories,  # ALL categories
-                'sex': plaintiffs[0].get('sex') if plaintiffs else None,  # Primary plaintiff
-                'age': plaintiffs[0].get('age') if plaintiffs else None,  # Primary plaintiff
+                'sex': primary_plaintiff.get('sex') if primary_plaintiff else None,  # Primary plaintiff
+                'age': primary_plaintiff.get('age') if primary_plaintiff else None,  # Primary plaintiff
                 'other_damages': other_damages_list,  # Pecuniary damages (economic losses)
                 'num_plaintiffs': len(plaintiffs),
                 'plaintiffs': plaintiffs,  # Keep full plaintiff data
-                'comments': case.get('comments', ''),
+                'comments': comments,
                 'judges': judges,
-                'family_law_act_claims': case.get('family_law_act_claims', [])
+                'family_law_act_claims': cg('family_law_act_claims', [])
             }
         }
 
         # Generate summary text for embedding
         summary_parts = []
-        injuries = case.get('injuries', [])
         if injuries:
             summary_parts.append(f"Injuries: {', '.join(injuries[:10])}")  # Limit to 10 for embedding
         if categories and categories != ['UNKNOWN']:
             summary_parts.append(f"Categories: {', '.join(categories)}")
-        if case.get('comments'):
-            summary_parts.append(f"Comments: {case.get('comments')}")
+        if comments:
+            summary_parts.append(f"Comments: {comments}")
 
-        summary_text = ' | '.join(summary_parts) if summary_parts else 'No summary available'
+        summary_text = ' | '.join(summary_parts) if summary_parts else NO_SUMMARY_TEXT
         dashboard_case['summary_text'] = summary_text
 
-        # Generate embedding
-        try:
-            embedding = model.encode(summary_text, convert_to_numpy=True)
-            dashboard_case['embedding'] = embedding.tolist()
-        except Exception as e:
-            print(f"⚠️  Warning: Could not generate embedding for case {dashboard_case['id']}: {e}")
-            # Use zero vector as fallback (768 dimensions for all-mpnet-base-v2)
-            dashboard_case['embedding'] = [0.0] * 768
+        # The stored summary keeps full comments for keyword search; the
+        # embedded text caps them, since the encoder truncates long input anyway
+        if comments and len(comments) > EMBED_MAX_COMMENT_CHARS:
+            summary_parts[-1] = f"Comments: {comments[:EMBED_MAX_COMMENT_CHARS]}"
+            embed_texts.append(' | '.join(summary_parts))
+        else:
+            embed_texts.append(summary_text)
 
         dashboard_cases.append(dashboard_case)
 
+    # Generate embeddings for distinct summaries not already cached, in one batched call
+    # (many cases share a summary, e.g. NO_SUMMARY_TEXT)
+    embedding_dim = model.get_sentence_embedding_dimension() or 768
+    cache = load_embedding_cache(cache_path) if cache_path else {}
+    encoder_signature = embedding_encoder_signature(model, max_seq_length)
+    keys = [summary_text_key(text, encoder_signature) for text in embed_texts]
+    todo = {}
+    for key, text in zip(keys, embed_texts):
+        if key not in cache:
+            todo.setdefault(key, text)
+    print(f"   ✓ {len(set(keys))} distinct summaries, {len(todo)} to encode")
+
+    if todo:
+        todo_keys = list(todo)
+        # Capped summaries fit in max_seq_length tokens; attention cost is
+        # quadratic in sequence length, so don't pad/attend past it
+        previous_max_seq_length = getattr(model, 'max_seq_length', None)
+        if max_seq_length and previous_max_seq_length:
+            model.max_seq_length = min(max_seq_length, previous_max_seq_length)
+        try:
+            embeddings = model.encode(
+                list(todo.values()),
+                batch_size=batch_size,
+                convert_to_numpy=True,
+                show_progress_bar=True
+            )
+            if embeddings.shape != (len(todo), embedding_dim):
+                raise ValueError(f"unexpected embedding shape {embeddings.shape}")
+            cache.update(zip(todo_keys, embeddings))
+        except Exception as e:
+            print(f"⚠️  Warning: Batch embedding failed ({e}), encoding summaries individually")
+            for key, text in todo.items():
+                try:
+                    cache[key] = model.encode(text, convert_to_numpy=True)
+                except Exception as e:
+                    print(f"⚠️  Warning: Could not generate embedding for summary {text[:60]!r}: {e}")
+        finally:
+            if previous_max_seq_length:
+                model.max_seq_length = previous_max_seq_length
+
+    # Keep only this run's entries so the cache doesn't grow without bound
+    used_keys = set(keys)
+    if cache_path and (todo or len(cache) != len(used_keys & cache.keys())):
+        save_embedding_cache({key: cache[key] for key in used_keys if key in cache}, cache_path)
+
+    # Cases with the same summary (e.g. NO_SUMMARY_TEXT) share one embedding,
+    # stored as a tuple so an in-place edit can't leak into other cases
+    shared_embeddings = {}
+    for dashboard_case, key in zip(dashboard_cases, keys):
+        shared = shared_embeddings.get(key)
+        if shared is None:
+            embedding = cache.get(key)
+            # Use zero vector as fallback, sized to the model's output
+            shared = tuple(embedding.tolist()) if embedding is not None else (0.0,) * embedding_dim
+            shared_embeddings[key] = shared
+        dashboard_case['embedding'] = shared
+
     return dashboard_cases
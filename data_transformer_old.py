@@ -4,74 +4,16 @@ Data transformer for Ontario Damages Compendium
 Converts parsed cases to dashboard format with embeddings.
 """
 
-import json
 from typing import List, Dict, Any
-from pathlib import Path
 
-
-def add_embeddings_to_cases(
-    input_json: str,
-    output_json: str
-) -> List[Dict[str, Any]]:
-    """
-    Transform parsed cases to dashboard format.
-
-    Args:
-        input_json: Path to raw parsed cases (from damages_parser_table.py)
-        output_json: Path to save dashboard-ready cases
-
-    Returns:
-        List of dashboard-ready cases
-    """
-    # Load raw parsed cases
-    with open(input_json, 'r', encoding='utf-8') as f:
-        raw_cases = json.load(f)
-
-    dashboard_cases = []
-
-    for idx, case in enumerate(raw_cases):
-        # Transform to dashboard format
-        dashboard_case = {
-            'id': f"case_{idx + 1:04d}",
-            'case_name': case.get('case_name', 'Unknown'),
-            'year': case.get('year'),
-            'court': case.get('court'),
-            'judge': case.get('judge'),
-            'citation': case.get('citation'),
-            'source_page': case.get('source_page'),
-            'category': case.get('category', 'UNKNOWN'),
-            'non_pecuniary_damages': case.get('non_pecuniary_damages'),
-            'pecuniary_damages': case.get('pecuniary_damages'),
-            'total_award': case.get('total_award'),
-            'comments': case.get('comments'),
-            'extended_data': {
-                'injuries': case.get('injuries', []),
-                'regions': [case.get('category', 'UNKNOWN')],  # Use category as region
-                'sex': case.get('sex'),
-                'age': case.get('age'),
-                'other_damages': case.get('other_damages', [])
-            }
-        }
-
-        # Handle multi-plaintiff cases
-        if case.get('plaintiffs'):
-            dashboard_case['plaintiffs'] = case['plaintiffs']
-
-        dashboard_cases.append(dashboard_case)
-
-    # Save dashboard cases
-    with open(output_json, 'w', encoding='utf-8') as f:
-        json.dump(dashboard_cases, f, indent=2, ensure_ascii=False)
-
-    print(f"✅ Transformed {len(dashboard_cases)} cases")
-    print(f"   Saved to: {output_json}")
-
-    return dashboard_cases
+# Single implementation lives in data_transformer; re-exported for old imports
+from data_transformer import add_embeddings_to_cases  # noqa: F401
 
 
 def convert_to_dashboard_format(
     ai_cases: List[Dict[str, Any]],
-    model
+    model,
+    batch_size: int = 64
 ) -> List[Dict[str, Any]]:
     """
     Convert AI-parsed format to dashboard format with embeddings.
@@ -82,6 +24,7 @@ def convert_to_dashboard_format(
     Args:
         ai_cases: List of cases in AI-parsed format (with 'plaintiffs' array)
         model: SentenceTransformer model for generating embeddings
+        batch_size: Number of summaries encoded per forward pass
 
     Returns:
         List of cases in dashboard format with embeddings
@@ -210,16 +153,27 @@ def convert_to_dashboard_format(
             summary_text = ' | '.join(summary_parts) if summary_parts else 'No summary available'
             dashboard_case['summary_text'] = summary_text
 
-            # Generate embedding
+            dashboard_cases.append(dashboard_case)
+            case_counter += 1
+
+    # Generate all embeddings in one batched call
+    summary_texts = [c['summary_text'] for c in dashboard_cases]
+    embedding_dim = model.get_sentence_embedding_dimension() or 384
+    try:
+        embeddings = model.encode(summary_texts, batch_size=batch_size, convert_to_numpy=True)
+        if embeddings.shape != (len(summary_texts), embedding_dim):
+            raise ValueError(f"unexpected embedding shape {embeddings.shape}")
+        for dashboard_case, embedding in zip(dashboard_cases, embeddings):
+            dashboard_case['embedding'] = embedding.tolist()
+    except Exception as e:
+        print(f"⚠️  Warning: Batch embedding failed ({e}), encoding summaries individually")
+        for dashboard_case in dashboard_cases:
             try:
-                embedding = model.encode(summary_text, convert_to_numpy=True)
+                embedding = model.encode(dashboard_case['summary_text'], convert_to_numpy=True)
                 dashboard_case['embedding'] = embedding.tolist()
             except Exception as e:
                 print(f"⚠️  Warning: Could not generate embedding for case {dashboard_case['id']}: {e}")
-                # Use zero vector as fallback
-                dashboard_case['embedding'] = [0.0] * 384  # all-MiniLM-L6-v2 dimension
-
-            dashboard_cases.append(dashboard_case)
-            case_counter += 1
+                # Use zero vector as fallback, sized to the model's output
+                dashboard_case['embedding'] = [0.0] * embedding_dim
 
     return dashboard_cases
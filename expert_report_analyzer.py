@@ -6,11 +6,20 @@ Focus: injury and functional outcome data only, not procedural information.
 """
 
 import pdfplumber
+from pdfminer.pdftypes import resolve1
 import re
+import asyncio
 from typing import Dict, List, Optional
 import json
 import os
 import logging
+import hashlib
+import sqlite3
+import threading
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -21,10 +30,130 @@ DEFAULT_LLM_MODEL_ANTHROPIC = "claude-3-haiku-20240307"
 MAX_REPORT_CHARS_FOR_LLM = 4000
 LLM_TEMPERATURE = 0.1
 LLM_MAX_TOKENS = 1000
+LLM_CACHE_PATH = ".expert_report_cache.sqlite"
+
+# Environment variable holding each provider's API key
+API_KEY_ENV_VARS = {
+    "openai": "OPENAI_API_KEY",
+    "anthropic": "ANTHROPIC_API_KEY",
+}
+
+# Fixed instructions go first and the report text last, so every request
+# shares one identical prefix (eligible for provider-side prompt caching)
+LLM_PROMPT_PREFIX = """Analyze the medical/expert report below and extract ONLY injuries and sequelae.
+
+Please extract and return ONLY a JSON object with this exact structure (no other text):
+{
+    "injuries": ["injury1", "injury2", ...],
+    "sequelae": ["functional limitation1", "limitation2", ...],
+    "severity": "mild|moderate|severe"
+}
+
+IMPORTANT:
+- injuries: List of diagnosed or described injuries (e.g., "C5-C6 disc herniation", "rotator cuff tear")
+- sequelae: List of functional consequences (e.g., "chronic pain", "reduced ROM", "paresthesia")
+- severity: Overall severity assessment from the report
+- Do NOT include case information, judge names, or procedural details
+- Be specific and clinical
+"""
+
+# pdfplumber fallback: when an analyzer is given a process pool (batch runs),
+# reports with at least this many pages are split into this many page ranges.
+# Each range re-parses the whole PDF, so short reports are faster in one pass.
+PDFPLUMBER_PARALLEL_MIN_PAGES = 32
+PDFPLUMBER_PAGE_CHUNKS = 4
+
+# Regex fallback patterns, compiled once at import. They run on lowercased
+# report text, so no IGNORECASE flag is needed. Every capture is bounded, and
+# captures without a lead-in phrase start on a word boundary so a failed
+# attempt is not retried from every character of the report.
+_INJURY_RES = tuple(
+    re.compile(pattern) for pattern in (
+        r"(?:diagnosed|presents with|history of|suffer[s]? from|sustained)\s+([^.]{10,80}?(?:injury|herniation|tear|fracture|strain|sprain|syndrome))",
+        r"\b(\w[^.]{9,79}?(?:disc|ligament|meniscus|tendon)\s+(?:herniation|tear|strain|rupture))",
+    )
+)
+_SEQUELAE_RES = tuple(
+    re.compile(pattern) for pattern in (
+        # Kept apart: a limitation lead-in often sits inside a consequence
+        # capture ("causes pain with walking..."), and one alternation would
+        # consume it
+        r"(?:results in|leading to|causes|symptom[s]?:?)\s+([^.]{5,60})",
+        r"(?:pain|limitation|difficulty|unable)\s+(?:with|to)\s+([^.]{5,60})",
+        r"\b(\w[^.]{4,59}?(?:pain|limitation|difficulty|dysfunction|weakness))",
+    )
+)
+
+# Optional single-pass prefilter for the fallback patterns
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+
+def _build_hyperscan_db():
+    """
+    Compile all fallback patterns into one Hyperscan database.
+
+    Hyperscan reports which patterns match (not capture groups), so it is
+    used only to skip patterns with no match before running re.findall.
+    """
+    if not HYPERSCAN_AVAILABLE:
+        return None
+    patterns = _INJURY_RES + _SEQUELAE_RES
+    # UTF8/UCP so character classes and repeat counts match re's str semantics
+    flags = (
+        hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_PREFILTER
+        | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+    )
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[p.pattern.encode('utf-8') for p in patterns],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=[flags] * len(patterns)
+        )
+        return db
+    except Exception as e:
+        logger.warning(f"Hyperscan compile failed ({e}), using re only")
+        return None
+
+
+_HYPERSCAN_DB = _build_hyperscan_db()
+
+
+def _matching_pattern_ids(text: str) -> Optional[set]:
+    """
+    Scan text once and return indices (into _INJURY_RES + _SEQUELAE_RES) of
+    patterns that may match, or None when Hyperscan is unavailable.
+    """
+    if _HYPERSCAN_DB is None:
+        return None
+
+    hits = set()
+
+    def on_match(pattern_id, start, end, flags, context):
+        hits.add(pattern_id)
+
+    try:
+        _HYPERSCAN_DB.scan(text.encode('utf-8'), match_event_handler=on_match)
+    except Exception as e:
+        logger.warning(f"Hyperscan scan failed ({e}), using re only")
+        return None
+    return hits
+
+
+# Severity keywords (substring matches, severe takes precedence over mild)
+_SEVERE_WORDS = frozenset({"severe", "significant", "major", "profound"})
+_MILD_WORDS = frozenset({"mild", "minor", "slight"})
+_SEVERITY_RE = re.compile("|".join(sorted(_SEVERE_WORDS | _MILD_WORDS)))
 
 # Optional LLM imports
 try:
     import openai
+    import httpx  # installed with openai
     OPENAI_AVAILABLE = True
 except ImportError:
     OPENAI_AVAILABLE = False
@@ -35,39 +164,293 @@ try:
 except ImportError:
     ANTHROPIC_AVAILABLE = False
 
+# Optional fast PDF text extraction (PDFium bindings)
+try:
+    import pypdfium2 as pdfium
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    PDFIUM_AVAILABLE = False
+
+
+def _build_http_client() -> "httpx.Client":
+    """Build a keep-alive HTTP client for the OpenAI SDK (HTTP/2 when h2 is installed)."""
+    limits = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+    try:
+        return httpx.Client(http2=True, timeout=30.0, limits=limits)
+    except ImportError:
+        # httpx needs the optional h2 package for HTTP/2
+        return httpx.Client(timeout=30.0, limits=limits)
+
+
+def _is_image_only_page(page) -> bool:
+    """
+    Check a pdfplumber page's resources for any possible text.
+
+    A page with no fonts and no form XObjects (scanned pages: just images)
+    cannot contain text, so its content stream need not be parsed at all.
+    """
+    try:
+        resources = resolve1(page.page_obj.resources) or {}
+        if "Font" in resources:
+            return False
+        xobjects = resolve1(resources.get("XObject")) or {}
+        for xobject in xobjects.values():
+            subtype = resolve1(xobject).attrs.get("Subtype")
+            if getattr(subtype, "name", subtype) != "Image":
+                return False
+        return True
+    except Exception:
+        return False
+
+
+def _extract_page_text(page) -> Optional[str]:
+    """Extract one pdfplumber page's text, skipping image-only pages."""
+    if _is_image_only_page(page):
+        return None
+    return page.extract_text()
+
+
+def _extract_page_range_with_pdfplumber(pdf_path: str, start: int, stop: int) -> List[Optional[str]]:
+    """Extract text for pages [start, stop) with pdfplumber (process pool worker)."""
+    with pdfplumber.open(pdf_path) as pdf:
+        return [_extract_page_text(page) for page in pdf.pages[start:stop]]
+
+
+class LLMResultCache:
+    """
+    Persistent cache of parsed LLM analyses, keyed by provider, model and prompt.
+
+    Backed by a single SQLite file so regenerating a dataset from the same
+    reports skips the API. Safe to share across threads.
+    """
+
+    def __init__(self, path: str = LLM_CACHE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS analyses (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(provider: str, model: str, prompt: str) -> str:
+        """Build a cache key from the provider, model name and exact prompt text."""
+        return hashlib.sha256(f"{provider}\x00{model}\x00{prompt}".encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached analysis for key, or None on a miss."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM analyses WHERE key = ?", (key,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, key: str, value: Dict) -> None:
+        """Store an analysis under key."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO analyses (key, value) VALUES (?, ?)",
+                (key, json.dumps(value))
+            )
+            self._conn.commit()
+
 
 class ExpertReportAnalyzer:
     """Analyzes medical/expert reports to extract injuries and sequelae."""
 
-    def __init__(self, api_key: Optional[str] = None, provider: str = "openai"):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        provider: str = "openai",
+        cache_path: Optional[str] = None,
+        pdf_executor: Optional[Executor] = None
+    ):
         """
         Initialize the analyzer.
 
         Args:
             api_key: API key for LLM provider (or set via env var)
             provider: "openai" or "anthropic"
+            cache_path: SQLite file for cached LLM analyses (None, the default,
+                disables caching; batch regeneration passes LLM_CACHE_PATH)
+            pdf_executor: Process pool to split long pdfplumber extractions
+                across. None (the default) extracts in-process; interactive
+                callers (the Streamlit server) should not start worker
+                processes. analyze_reports_batch shares one spawn-based pool.
         """
         self.provider = provider
-
+        self.api_key = None
+        self.client = None
+        self.async_client = None
+        self.cache_path = cache_path
+        self._cache = None
+        self.pdf_executor = pdf_executor
+
+        # One client per analyzer so every report reuses its pooled connections
         if provider == "openai" and OPENAI_AVAILABLE:
-            self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+            self.api_key = api_key or os.getenv(API_KEY_ENV_VARS["openai"])
             if self.api_key:
-                openai.api_key = self.api_key
+                self.client = openai.OpenAI(api_key=self.api_key, http_client=_build_http_client())
         elif provider == "anthropic" and ANTHROPIC_AVAILABLE:
-            self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
+            self.api_key = api_key or os.getenv(API_KEY_ENV_VARS["anthropic"])
             if self.api_key:
                 self.client = anthropic.Anthropic(api_key=self.api_key)
 
     def extract_text_from_pdf(self, pdf_path: str) -> str:
-        """Extract text from PDF file."""
-        text = []
+        """
+        Extract text from PDF file.
+
+        Uses pypdfium2 when installed (much faster than pdfplumber),
+        falling back to pdfplumber if it is missing or fails.
+        """
+        if PDFIUM_AVAILABLE:
+            try:
+                return self._extract_text_with_pdfium(pdf_path)
+            except Exception as e:
+                logger.warning(f"pypdfium2 extraction failed ({e}), falling back to pdfplumber")
+
         with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
+            num_pages = len(pdf.pages)
+            if self.pdf_executor is None or num_pages < PDFPLUMBER_PARALLEL_MIN_PAGES:
+                page_texts = [_extract_page_text(page) for page in pdf.pages]
+            else:
+                page_texts = None
+
+        # Long reports (opt-in): split pdfplumber's per-page layout analysis across processes
+        if page_texts is None:
+            page_texts = self._extract_pages_in_parallel(pdf_path, num_pages)
+
+        return "\n\n".join(page_text for page_text in page_texts if page_text)
+
+    def _extract_pages_in_parallel(self, pdf_path: str, num_pages: int) -> List[Optional[str]]:
+        """
+        Run pdfplumber over contiguous page ranges in the analyzer's process pool.
+
+        pdfminer layout analysis is CPU-bound, so threads would not help. The
+        pool is shared by every report in a batch, so it alone bounds the
+        number of worker processes. Falls back to a single pass if the pool
+        fails.
+        """
+        chunk = -(-num_pages // PDFPLUMBER_PAGE_CHUNKS)
+        starts = range(0, num_pages, chunk)
+        try:
+            futures = [
+                self.pdf_executor.submit(_extract_page_range_with_pdfplumber, pdf_path, start, start + chunk)
+                for start in starts
+            ]
+            return [page_text for future in futures for page_text in future.result()]
+        except Exception as e:
+            logger.warning(f"Parallel pdfplumber extraction failed ({e}), extracting sequentially")
+            return _extract_page_range_with_pdfplumber(pdf_path, 0, num_pages)
+
+    @staticmethod
+    def _extract_text_with_pdfium(pdf_path: str) -> str:
+        """Extract text from PDF file with PDFium (pages joined like pdfplumber)."""
+        text = []
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            for page in pdf:
+                textpage = page.get_textpage()
+                page_text = textpage.get_text_range().replace("\r\n", "\n").strip()
+                textpage.close()
+                page.close()
                 if page_text:
                     text.append(page_text)
+        finally:
+            pdf.close()
         return "\n\n".join(text)
 
+    def _build_llm_prompt(self, report_text: str) -> str:
+        """Build the injury/sequelae extraction prompt, truncating long reports."""
+        # Truncate if needed
+        if len(report_text) > MAX_REPORT_CHARS_FOR_LLM:
+            logger.warning(
+                f"Report text truncated from {len(report_text)} to {MAX_REPORT_CHARS_FOR_LLM}."
+            )
+            report_text_truncated = report_text[:MAX_REPORT_CHARS_FOR_LLM]
+        else:
+            report_text_truncated = report_text
+
+        return f"{LLM_PROMPT_PREFIX}\nREPORT TEXT:\n{report_text_truncated}\n"
+
+    @staticmethod
+    def _openai_request(prompt: str) -> Dict:
+        """Chat completions arguments for the OpenAI clients."""
+        return dict(
+            model=DEFAULT_LLM_MODEL_OPENAI,
+            messages=[
+                {
+                    "role": "system",
+                    "content": "You are a medical report analyzer. Return ONLY valid JSON."
+                },
+                {"role": "user", "content": prompt}
+            ],
+            temperature=LLM_TEMPERATURE,
+            max_tokens=LLM_MAX_TOKENS
+        )
+
+    @staticmethod
+    def _anthropic_request(prompt: str) -> Dict:
+        """Messages arguments for the Anthropic clients."""
+        return dict(
+            model=DEFAULT_LLM_MODEL_ANTHROPIC,
+            max_tokens=LLM_MAX_TOKENS,
+            temperature=LLM_TEMPERATURE,
+            messages=[{"role": "user", "content": prompt}]
+        )
+
+    @staticmethod
+    def _parse_llm_json(result_text: str) -> Dict:
+        """Parse the model's JSON answer, stripping markdown code fences."""
+        result_text = result_text.strip()
+
+        # Extract JSON from response (text between the first fence and the next one)
+        _, fence, rest = result_text.partition("```json")
+        if not fence:
+            _, fence, rest = result_text.partition("```")
+        if fence:
+            result_text = rest.partition("```")[0].strip()
+
+        return json.loads(result_text)
+
+    def _get_cache(self) -> Optional[LLMResultCache]:
+        """Open the LLM result cache on first use (None when caching is disabled)."""
+        if self._cache is None and self.cache_path:
+            try:
+                self._cache = LLMResultCache(self.cache_path)
+            except Exception as e:
+                # Caching is an optimization; carry on without it
+                logger.warning(f"LLM cache unavailable ({e}), continuing without it")
+                self.cache_path = None
+        return self._cache
+
+    def _cache_get(self, cache_key: str) -> Optional[Dict]:
+        """Look up a cached analysis, treating cache errors as a miss."""
+        cache = self._get_cache()
+        if cache is None:
+            return None
+        try:
+            return cache.get(cache_key)
+        except Exception as e:
+            logger.warning(f"LLM cache read failed: {e}")
+            return None
+
+    def _cache_set(self, cache_key: str, result: Dict) -> None:
+        """Store an analysis in the cache, ignoring cache errors."""
+        cache = self._get_cache()
+        if cache is None:
+            return
+        try:
+            cache.set(cache_key, result)
+        except Exception as e:
+            logger.warning(f"LLM cache write failed: {e}")
+
+    def _llm_cache_key(self, prompt: str) -> str:
+        """Cache key for a prompt sent to this analyzer's provider and model."""
+        model = DEFAULT_LLM_MODEL_ANTHROPIC if self.provider == "anthropic" else DEFAULT_LLM_MODEL_OPENAI
+        return LLMResultCache.make_key(self.provider, model, prompt)
+
     def analyze_with_llm(self, report_text: str) -> Dict:
         """
         Analyze report text with LLM to extract injuries and sequelae only.
@@ -82,125 +465,113 @@ class ExpertReportAnalyzer:
         if not self.api_key:
             return self._analyze_with_regex(report_text)
 
-        # Truncate if needed
-        if len(report_text) > MAX_REPORT_CHARS_FOR_LLM:
-            logger.warning(
-                f"Report text truncated from {len(report_text)} to {MAX_REPORT_CHARS_FOR_LLM}."
-            )
-            report_text_truncated = report_text[:MAX_REPORT_CHARS_FOR_LLM]
-        else:
-            report_text_truncated = report_text
+        prompt = self._build_llm_prompt(report_text)
 
-        prompt = f"""Analyze this medical/expert report and extract ONLY injuries and sequelae.
+        # Identical reports (e.g. when regenerating a dataset) skip the API
+        cache_key = self._llm_cache_key(prompt)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
 
-REPORT TEXT:
-{report_text_truncated}
+        try:
+            if self.provider == "openai" and OPENAI_AVAILABLE:
+                response = self.client.chat.completions.create(**self._openai_request(prompt))
+                result = self._parse_llm_json(response.choices[0].message.content)
 
-Please extract and return ONLY a JSON object with this exact structure (no other text):
-{{
-    "injuries": ["injury1", "injury2", ...],
-    "sequelae": ["functional limitation1", "limitation2", ...],
-    "severity": "mild|moderate|severe"
-}}
+            elif self.provider == "anthropic" and ANTHROPIC_AVAILABLE:
+                message = self.client.messages.create(**self._anthropic_request(prompt))
+                result = self._parse_llm_json(message.content[0].text)
 
-IMPORTANT:
-- injuries: List of diagnosed or described injuries (e.g., "C5-C6 disc herniation", "rotator cuff tear")
-- sequelae: List of functional consequences (e.g., "chronic pain", "reduced ROM", "paresthesia")
-- severity: Overall severity assessment from the report
-- Do NOT include case information, judge names, or procedural details
-- Be specific and clinical
-"""
+            else:
+                return self._analyze_with_regex(report_text)
 
-        try:
-            if self.provider == "openai" and OPENAI_AVAILABLE:
-                response = openai.chat.completions.create(
-                    model=DEFAULT_LLM_MODEL_OPENAI,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are a medical report analyzer. Return ONLY valid JSON."
-                        },
-                        {"role": "user", "content": prompt}
-                    ],
-                    temperature=LLM_TEMPERATURE,
-                    max_tokens=LLM_MAX_TOKENS
-                )
-
-                result_text = response.choices[0].message.content.strip()
-
-                # Extract JSON from response
-                if "```json" in result_text:
-                    result_text = result_text.split("```json")[1].split("```")[0].strip()
-                elif "```" in result_text:
-                    result_text = result_text.split("```")[1].split("```")[0].strip()
-
-                return json.loads(result_text)
+        except Exception as e:
+            logger.error(f"LLM analysis failed: {e}")
+            return self._analyze_with_regex(report_text)
 
+        self._cache_set(cache_key, result)
+        return result
+
+    def _get_async_client(self):
+        """Create the async LLM client on first use (one per analyzer)."""
+        if self.async_client is None:
+            if self.provider == "openai" and OPENAI_AVAILABLE:
+                self.async_client = openai.AsyncOpenAI(api_key=self.api_key)
             elif self.provider == "anthropic" and ANTHROPIC_AVAILABLE:
-                message = self.client.messages.create(
-                    model=DEFAULT_LLM_MODEL_ANTHROPIC,
-                    max_tokens=LLM_MAX_TOKENS,
-                    temperature=LLM_TEMPERATURE,
-                    messages=[{"role": "user", "content": prompt}]
-                )
+                self.async_client = anthropic.AsyncAnthropic(api_key=self.api_key)
+        return self.async_client
+
+    async def analyze_with_llm_async(self, report_text: str) -> Dict:
+        """
+        Async version of analyze_with_llm (same result format and fallbacks).
+
+        The SQLite cache and the CPU-bound regex fallback run in worker threads
+        so they don't stall other reports' in-flight LLM requests.
+        """
+        if not self.api_key:
+            return await asyncio.to_thread(self._analyze_with_regex, report_text)
+
+        prompt = self._build_llm_prompt(report_text)
+
+        cache_key = self._llm_cache_key(prompt)
+        cached = await asyncio.to_thread(self._cache_get, cache_key)
+        if cached is not None:
+            return cached
 
-                result_text = message.content[0].text.strip()
+        try:
+            client = self._get_async_client()
+            if self.provider == "openai" and OPENAI_AVAILABLE:
+                response = await client.chat.completions.create(**self._openai_request(prompt))
+                result = self._parse_llm_json(response.choices[0].message.content)
 
-                # Extract JSON from response
-                if "```json" in result_text:
-                    result_text = result_text.split("```json")[1].split("```")[0].strip()
-                elif "```" in result_text:
-                    result_text = result_text.split("```")[1].split("```")[0].strip()
+            elif self.provider == "anthropic" and ANTHROPIC_AVAILABLE:
+                message = await client.messages.create(**self._anthropic_request(prompt))
+                result = self._parse_llm_json(message.content[0].text)
 
-                return json.loads(result_text)
+            else:
+                return await asyncio.to_thread(self._analyze_with_regex, report_text)
 
         except Exception as e:
             logger.error(f"LLM analysis failed: {e}")
-            return self._analyze_with_regex(report_text)
+            return await asyncio.to_thread(self._analyze_with_regex, report_text)
 
-        return self._analyze_with_regex(report_text)
+        await asyncio.to_thread(self._cache_set, cache_key, result)
+        return result
 
     def _analyze_with_regex(self, report_text: str) -> Dict:
         """Fallback regex-based analysis for injuries and sequelae."""
         text_lower = report_text.lower()
 
-        # Extract injuries using patterns
-        injuries = []
-        injury_patterns = [
-            r"(?:diagnosed|presents with|history of|suffer[s]? from|sustained)\s+([^.]{10,80}?(?:injury|herniation|tear|fracture|strain|sprain|syndrome))",
-            r"([^.]{10,80}?(?:disc|ligament|meniscus|tendon)\s+(?:herniation|tear|strain|rupture))",
-        ]
+        # Patterns with at least one match (None = run them all)
+        candidates = _matching_pattern_ids(text_lower)
 
-        for pattern in injury_patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            injuries.extend([m.strip()[:80] for m in matches])
-
-        injuries = list(set(injuries))
+        # Extract injuries using patterns (sets dedupe as they go)
+        injuries = set()
+        for pattern_id, pattern in enumerate(_INJURY_RES):
+            if candidates is not None and pattern_id not in candidates:
+                continue
+            matches = pattern.findall(text_lower)
+            injuries.update(m.strip()[:80] for m in matches)
 
         # Extract sequelae using patterns
-        sequelae = []
-        sequelae_patterns = [
-            r"(?:results in|leading to|causes|symptom[s]?:?)\s+([^.]{5,60})",
-            r"(?:pain|limitation|difficulty|unable)\s+(?:with|to)\s+([^.]{5,60})",
-            r"([^.]{5,60}?(?:pain|limitation|difficulty|dysfunction|weakness))",
-        ]
-
-        for pattern in sequelae_patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            sequelae.extend([m.strip()[:80] for m in matches])
-
-        sequelae = list(set(sequelae))
-
-        # Detect severity
+        sequelae = set()
+        for pattern_id, pattern in enumerate(_SEQUELAE_RES, start=len(_INJURY_RES)):
+            if candidates is not None and pattern_id not in candidates:
+                continue
+            matches = pattern.findall(text_lower)
+            sequelae.update(m.strip()[:80] for m in matches)
+
+        # Detect severity in one scan over the text
+        found_words = set(_SEVERITY_RE.findall(text_lower))
         severity = "moderate"
-        if any(word in text_lower for word in ["severe", "significant", "major", "profound"]):
+        if found_words & _SEVERE_WORDS:
             severity = "severe"
-        elif any(word in text_lower for word in ["mild", "minor", "slight"]):
+        elif found_words & _MILD_WORDS:
             severity = "mild"
 
         return {
-            "injuries": injuries[:10],
-            "sequelae": sequelae[:10],
+            "injuries": list(islice(injuries, 10)),
+            "sequelae": list(islice(sequelae, 10)),
             "severity": severity
         }
 
@@ -230,6 +601,28 @@ IMPORTANT:
 
         return result
 
+    async def analyze_report_async(self, pdf_path: str, use_llm: bool = True) -> Dict:
+        """
+        Async version of analyze_report.
+
+        PDF text extraction and regex analysis are blocking, so they run in
+        worker threads while other reports wait on the LLM.
+        """
+        text = await asyncio.to_thread(self.extract_text_from_pdf, pdf_path)
+
+        if not text.strip():
+            raise ValueError("Could not extract text from PDF")
+
+        if use_llm and self.api_key:
+            result = await self.analyze_with_llm_async(text)
+        else:
+            result = await asyncio.to_thread(self._analyze_with_regex, text)
+
+        result["source_file"] = Path(pdf_path).name
+        result["extraction_method"] = "llm" if (use_llm and self.api_key) else "regex"
+
+        return result
+
 
 def analyze_expert_report(
     pdf_path: str,
@@ -242,5 +635,61 @@ def analyze_expert_report(
 
     Returns only injuries and sequelae data for search use.
     """
-    analyzer = ExpertReportAnalyzer(api_key=api_key, provider=provider)
+    # Resolve the env var on every call so a key set or rotated later is used
+    if not api_key:
+        api_key = os.getenv(API_KEY_ENV_VARS.get(provider, ""))
+    analyzer = _get_analyzer(api_key, provider)
     return analyzer.analyze_report(pdf_path, use_llm=use_llm)
+
+
+@lru_cache(maxsize=8)
+def _get_analyzer(api_key: Optional[str], provider: str) -> ExpertReportAnalyzer:
+    """Reuse one analyzer (and its LLM client) per resolved API key and provider."""
+    return ExpertReportAnalyzer(api_key=api_key, provider=provider)
+
+
+async def analyze_reports_batch(
+    pdf_paths: List[str],
+    api_key: Optional[str] = None,
+    provider: str = "openai",
+    use_llm: bool = True,
+    concurrency: int = 16,
+    cache_path: Optional[str] = LLM_CACHE_PATH
+) -> List[Dict]:
+    """
+    Analyze many expert reports concurrently.
+
+    Up to `concurrency` reports are in flight at once; long pdfplumber
+    extractions share one spawn-based process pool sized to the CPU count
+    (spawn, because the batch runs in a multi-threaded process). Results
+    are returned in input order; a report that fails yields {"source_file", "error"}
+    instead of aborting the batch. LLM analyses are cached in `cache_path`
+    (None disables) so regenerating a dataset skips unchanged reports.
+
+    Usage:
+        results = asyncio.run(analyze_reports_batch(paths))
+    """
+    pdf_executor = ProcessPoolExecutor(
+        max_workers=os.cpu_count() or 1,
+        mp_context=multiprocessing.get_context("spawn")
+    )
+    analyzer = ExpertReportAnalyzer(
+        api_key=api_key,
+        provider=provider,
+        cache_path=cache_path,
+        pdf_executor=pdf_executor
+    )
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def analyze_one(pdf_path: str) -> Dict:
+        async with semaphore:
+            try:
+                return await analyzer.analyze_report_async(pdf_path, use_llm=use_llm)
+            except Exception as e:
+                logger.error(f"Analysis failed for {pdf_path}: {e}")
+                return {"source_file": Path(pdf_path).name, "error": str(e)}
+
+    try:
+        return await asyncio.gather(*(analyze_one(p) for p in pdf_paths))
+    finally:
+        pdf_executor.shutdown()
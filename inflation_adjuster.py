@@ -4,10 +4,12 @@ Adjusts historical damage awards to current dollars using Bank of Canada CPI dat
 """
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, Dict, List
-import csv
+import numpy as np
 from pathlib import Path
 import re
+import pandas as pd
 import requests
 from io import StringIO
 
@@ -17,6 +19,9 @@ DEFAULT_REFERENCE_YEAR = 2025
 # Path to Bank of Canada CPI CSV file
 BOC_CPI_CSV = Path(__file__).parent / "data" / "boc_cpi.csv"
 
+# Monthly observation dates in the CSV (format: YYYY-MM)
+CPI_DATE_RE = re.compile(r'^\d{4}-\d{2}$')
+
 # Fallback CPI data (if CSV not available)
 # Comprehensive Bank of Canada CPI data (1914-2025)
 # Annual averages calculated from monthly BOC Total CPI values
@@ -38,6 +43,13 @@ FALLBACK_CPI_DATA = {
 # Cache for loaded CPI data
 _cpi_cache: Optional[Dict[int, float]] = None
 
+# Same data as an array indexed by (year - _cpi_min_year), NaN for missing years
+_cpi_min_year: int = 0
+_cpi_by_year: Optional[np.ndarray] = None
+
+# Sorted years of the cached data (for the year-range helpers)
+_cpi_years: tuple = ()
+
 
 def load_boc_cpi_data(csv_path: Path = BOC_CPI_CSV) -> Dict[int, float]:
     """
@@ -57,43 +69,39 @@ def load_boc_cpi_data(csv_path: Path = BOC_CPI_CSV) -> Dict[int, float]:
     if not csv_path.exists():
         return None
 
-    try:
-        monthly_data = {}
-
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            header = next(reader)  # Skip header
-
-            for row in reader:
-                if not row or len(row) < 2:
-                    continue
+    # Reuse the parsed averages if the sidecar is at least as new as the CSV
+    cache_path = csv_path.with_suffix('.npz')
+    cached = _load_cpi_sidecar(cache_path, csv_path)
+    if cached is not None:
+        return cached
 
-                # Parse date (format: YYYY-MM)
-                date_str = row[0].strip()
-                if not re.match(r'^\d{4}-\d{2}$', date_str):
-                    continue
-
-                year, month = date_str.split('-')
-                year = int(year)
-
-                # Get CPI value (second column - v41690973 "All-items")
-                try:
-                    cpi_str = row[1].strip().rstrip('R').strip()  # Remove 'R' revision indicator
-                    cpi = float(cpi_str)
-                except (ValueError, IndexError):
-                    continue
-
-                # Store monthly data
-                if year not in monthly_data:
-                    monthly_data[year] = []
-                monthly_data[year].append(cpi)
+    try:
+        # Only the date and all-items CPI columns matter; rows may be ragged
+        df = pd.read_csv(
+            csv_path,
+            header=None,
+            skiprows=1,  # Skip header
+            usecols=[0, 1],
+            names=['date', 'cpi'],
+            dtype=str,
+            encoding='utf-8',
+        )
+
+        # Keep monthly observations only (format: YYYY-MM)
+        dates = df['date'].str.strip()
+        monthly = df[dates.str.match(CPI_DATE_RE, na=False)]
+
+        # Remove 'R' revision indicator; unparseable values are dropped
+        cpi = pd.to_numeric(
+            monthly['cpi'].str.strip().str.rstrip('R').str.strip(), errors='coerce'
+        )
+        years = dates[monthly.index].str[:4].astype(int)
 
         # Calculate annual averages
-        annual_data = {}
-        for year, values in monthly_data.items():
-            if values:
-                annual_data[year] = sum(values) / len(values)
+        annual = cpi.groupby(years).mean().dropna()
+        annual_data = {int(year): float(value) for year, value in annual.items()}
 
+        _save_cpi_sidecar(cache_path, annual_data)
         return annual_data
 
     except Exception as e:
@@ -101,6 +109,29 @@ def load_boc_cpi_data(csv_path: Path = BOC_CPI_CSV) -> Dict[int, float]:
         return None
 
 
+def _load_cpi_sidecar(cache_path: Path, csv_path: Path) -> Optional[Dict[int, float]]:
+    """Load annual CPI averages saved next to the CSV, or None if missing or stale"""
+    try:
+        if cache_path.stat().st_mtime < csv_path.stat().st_mtime:
+            return None
+        with np.load(cache_path) as data:
+            return {int(year): float(cpi) for year, cpi in zip(data['years'], data['cpi'])}
+    except Exception:
+        return None
+
+
+def _save_cpi_sidecar(cache_path: Path, annual_data: Dict[int, float]) -> None:
+    """Save annual CPI averages next to the CSV (best effort, e.g. read-only deploys)"""
+    try:
+        np.savez(
+            cache_path,
+            years=np.array(list(annual_data.keys()), dtype=np.int32),
+            cpi=np.array(list(annual_data.values()), dtype=np.float64)
+        )
+    except Exception:
+        pass
+
+
 def download_boc_cpi_data(
     url: str = "https://www.bankofcanada.ca/valet/observations/V41690973/csv",
     save_path: Path = BOC_CPI_CSV,
@@ -195,14 +226,31 @@ def get_cpi_data(auto_download: bool = False) -> Dict[int, float]:
         boc_data = download_boc_cpi_data()
 
     if boc_data and len(boc_data) > 10:  # Ensure we got reasonable data
-        _cpi_cache = boc_data
+        _set_cpi_cache(boc_data)
         return _cpi_cache
 
     # Fallback to hardcoded data
-    _cpi_cache = FALLBACK_CPI_DATA.copy()
+    _set_cpi_cache(FALLBACK_CPI_DATA.copy())
     return _cpi_cache
 
 
+def _set_cpi_cache(cpi_data: Dict[int, float]) -> None:
+    """Store CPI data in the dict cache and the year-indexed array, dropping memoized lookups"""
+    global _cpi_cache, _cpi_min_year, _cpi_by_year, _cpi_years
+
+    _cpi_cache = cpi_data
+    _cpi_years = tuple(sorted(cpi_data))
+    get_cpi_for_year.cache_clear()
+    get_inflation_rate.cache_clear()
+    adjust_for_inflation.cache_clear()
+
+    _cpi_min_year = min(cpi_data)
+    _cpi_by_year = np.array(
+        [cpi_data.get(year, np.nan) for year in range(_cpi_min_year, max(cpi_data) + 1)],
+        dtype=np.float64
+    )
+
+
 def reload_cpi_data(download_fresh: bool = False) -> Dict[int, float]:
     """
     Force reload of CPI data from CSV (useful after updating the file)
@@ -213,8 +261,9 @@ def reload_cpi_data(download_fresh: bool = False) -> Dict[int, float]:
     Returns:
         Dictionary of CPI data
     """
-    global _cpi_cache
+    global _cpi_cache, _cpi_by_year
     _cpi_cache = None
+    _cpi_by_year = None
 
     if download_fresh:
         download_boc_cpi_data()
@@ -232,6 +281,7 @@ def update_cpi_data() -> Optional[Dict[int, float]]:
     return download_boc_cpi_data()
 
 
+@lru_cache(maxsize=256)
 def get_cpi_for_year(year: int) -> Optional[float]:
     """
     Get CPI value for a specific year
@@ -246,6 +296,8 @@ def get_cpi_for_year(year: int) -> Optional[float]:
     return cpi_data.get(year)
 
 
+# Awards cluster on common amounts and years, so repeat adjustments are frequent
+@lru_cache(maxsize=4096)
 def adjust_for_inflation(
     amount: float,
     original_year: int,
@@ -274,6 +326,46 @@ def adjust_for_inflation(
     return round(adjusted, 2)
 
 
+def adjust_for_inflation_batch(
+    amounts: np.ndarray,
+    original_years: np.ndarray,
+    target_year: int = DEFAULT_REFERENCE_YEAR
+) -> np.ndarray:
+    """
+    Adjust many dollar amounts for inflation at once
+
+    Vectorized version of adjust_for_inflation for bulk adjustments.
+
+    Args:
+        amounts: Original dollar amounts
+        original_years: Year of each amount (same length as amounts)
+        target_year: Year to adjust to (default: current year)
+
+    Returns:
+        Array of inflation-adjusted amounts, NaN where CPI data is unavailable
+    """
+    get_cpi_data()
+
+    amounts = np.asarray(amounts, dtype=np.float64)
+
+    # Years that are missing, non-numeric or fractional get no CPI (NaN result)
+    years = pd.to_numeric(pd.Series(original_years, dtype=object), errors='coerce').to_numpy(dtype=np.float64)
+    valid = np.isfinite(years) & (years == np.floor(years))
+    offsets = np.where(valid, years, 0).astype(np.int64) - _cpi_min_year
+    in_range = valid & (offsets >= 0) & (offsets < len(_cpi_by_year))
+
+    original_cpi = np.full(offsets.shape, np.nan)
+    original_cpi[in_range] = _cpi_by_year[offsets[in_range]]
+
+    target_cpi = get_cpi_for_year(target_year)
+    if target_cpi is None:
+        target_cpi = np.nan
+
+    # Adjustment formula: amount * (target_cpi / original_cpi)
+    return np.round(amounts * (target_cpi / original_cpi), 2)
+
+
+@lru_cache(maxsize=256)
 def get_inflation_rate(start_year: int, end_year: int) -> Optional[float]:
     """
     Calculate inflation rate between two years
@@ -328,20 +420,20 @@ def format_inflation_info(
 
 def get_available_years() -> List[int]:
     """Get list of years with available CPI data"""
-    cpi_data = get_cpi_data()
-    return sorted(cpi_data.keys())
+    get_cpi_data()
+    return list(_cpi_years)
 
 
 def get_earliest_year() -> int:
     """Get earliest year with CPI data"""
-    years = get_available_years()
-    return min(years) if years else 2000
+    get_cpi_data()
+    return _cpi_years[0] if _cpi_years else 2000
 
 
 def get_latest_year() -> int:
     """Get latest year with CPI data"""
-    years = get_available_years()
-    return max(years) if years else DEFAULT_REFERENCE_YEAR
+    get_cpi_data()
+    return _cpi_years[-1] if _cpi_years else DEFAULT_REFERENCE_YEAR
 
 
 def get_data_source() -> str:
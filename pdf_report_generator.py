@@ -13,19 +13,20 @@ from reportlab.platypus import (
 )
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT, TA_JUSTIFY
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import BinaryIO, List, Dict, Optional, Union
 import numpy as np
 
 
 class DamagesReportGenerator:
     """Generates professional PDF reports for damages analysis"""
 
-    def __init__(self, output_path: str, pagesize=letter):
+    def __init__(self, output_path: Union[str, BinaryIO], pagesize=letter):
         """
         Initialize the report generator
 
         Args:
-            output_path: Path where PDF will be saved
+            output_path: Path where PDF will be saved, or a writable binary
+                buffer (e.g. io.BytesIO) to render in memory
             pagesize: Page size (letter or A4)
         """
         self.output_path = output_path
@@ -178,10 +179,12 @@ class DamagesReportGenerator:
             Paragraph("Damage Award Summary", self.styles['SectionHeader'])
         )
 
-        median_val = np.median(damages_values)
-        min_val = np.min(damages_values)
-        max_val = np.max(damages_values)
-        mean_val = np.mean(damages_values)
+        # One array for all four statistics
+        damages_array = np.asarray(damages_values, dtype=np.float64)
+        median_val = np.median(damages_array)
+        min_val = damages_array.min()
+        max_val = damages_array.max()
+        mean_val = damages_array.mean()
 
         summary_data = [
             ['Statistic', 'Amount'],
@@ -355,7 +358,7 @@ class DamagesReportGenerator:
 
 
 def generate_damages_report(
-    output_path: str,
+    output_path: Union[str, BinaryIO],
     selected_regions: List[str],
     region_labels: Dict[str, str],
     injury_description: str,
@@ -369,7 +372,7 @@ def generate_damages_report(
     Convenience function to generate a complete damages report
 
     Args:
-        output_path: Where to save the PDF
+        output_path: Where to save the PDF (path or writable binary buffer)
         selected_regions: List of region IDs
         region_labels: Map of region IDs to clinical labels
         injury_description: User's injury description
@@ -380,7 +383,7 @@ def generate_damages_report(
         max_cases: Maximum cases to include in report
 
     Returns:
-        Path to generated PDF
+        Path to generated PDF (or the buffer it was written to)
     """
     generator = DamagesReportGenerator(output_path)
 
@@ -8,6 +8,7 @@ Business logic has been moved to app/ modules for better organization.
 
 import streamlit as st
 import numpy as np
+import io
 import tempfile
 import os
 import json
@@ -947,34 +948,31 @@ with tab1:
                         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                         pdf_filename = f"damages_report_{timestamp}.pdf"
 
-                        with tempfile.TemporaryDirectory() as tmpdir:
-                            pdf_path = os.path.join(tmpdir, pdf_filename)
-
-                            generate_damages_report(
-                                output_path=pdf_path,
-                                selected_regions=search_data['selected_regions'],
-                                region_labels=region_labels,
-                                injury_description=search_data['injury_text'],
-                                results=results,
-                                damages_values=damages_values,
-                                gender=search_data['gender'] if search_data['gender'] != "Not Specified" else None,
-                                age=search_data['age'],
-                                max_cases=num_cases
-                            )
-
-                            with open(pdf_path, 'rb') as pdf_file:
-                                pdf_data = pdf_file.read()
-
-                            st.success("✅ PDF report generated successfully!")
-
-                            st.download_button(
-                                label="💾 Download PDF Report",
-                                data=pdf_data,
-                                file_name=pdf_filename,
-                                mime="application/pdf",
-                                type="primary",
-                                width="stretch"
-                            )
+                        # Render in memory; the bytes go straight to the download button
+                        pdf_buffer = io.BytesIO()
+                        generate_damages_report(
+                            output_path=pdf_buffer,
+                            selected_regions=search_data['selected_regions'],
+                            region_labels=region_labels,
+                            injury_description=search_data['injury_text'],
+                            results=results,
+                            damages_values=damages_values,
+                            gender=search_data['gender'] if search_data['gender'] != "Not Specified" else None,
+                            age=search_data['age'],
+                            max_cases=num_cases
+                        )
+                        pdf_data = pdf_buffer.getvalue()
+
+                        st.success("✅ PDF report generated successfully!")
+
+                        st.download_button(
+                            label="💾 Download PDF Report",
+                            data=pdf_data,
+                            file_name=pdf_filename,
+                            mime="application/pdf",
+                            type="primary",
+                            width="stretch"
+                        )
 
                     except Exception as e:
                         st.error(f"❌ Error generating PDF: {str(e)}")
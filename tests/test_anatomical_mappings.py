@@ -8,7 +8,12 @@ from pathlib import Path
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from anatomical_mappings import map_anatomical_term_to_regions
+import anatomical_mappings
+from anatomical_mappings import (
+    map_anatomical_term_to_regions,
+    _laterality_flags,
+    _find_anatomical_terms
+)
 
 
 def test_anatomical_mappings():
@@ -39,5 +44,42 @@ def test_anatomical_mappings():
     print("✅ All anatomical mapping tests completed")
 
 
+def test_laterality_flags():
+    """Test laterality detection, including overlapping abbreviations"""
+    print("Testing laterality flags...")
+
+    assert _laterality_flags("left knee and rt shoulder") == (True, True, False)
+    # "b/lt" holds both "b/l" and "lt"; the lookahead scan must report both
+    assert _laterality_flags("b/lt hips") == (True, False, True)
+    assert _laterality_flags("both wrists") == (False, False, True)
+    assert _laterality_flags("cervical strain") == (False, False, False)
+
+    print("✅ Laterality flags test passed")
+
+
+def test_find_anatomical_terms():
+    """Test term lookup with and without the pyahocorasick automaton"""
+    print("Testing anatomical term lookup...")
+
+    text = "comminuted tibial fracture of the left knee; acl tear, knee effusion"
+    expected = {"tibia": 11, "tibial": 11, "knee": 39, "acl": 45}
+
+    found = _find_anatomical_terms(text)
+    print(f"Found terms: {found}")
+    assert found == expected
+
+    # The substring fallback must give the same first indices
+    automaton = anatomical_mappings._TERM_AUTOMATON
+    anatomical_mappings._TERM_AUTOMATON = None
+    try:
+        assert _find_anatomical_terms(text) == expected
+    finally:
+        anatomical_mappings._TERM_AUTOMATON = automaton
+
+    print("✅ Anatomical term lookup test passed")
+
+
 if __name__ == "__main__":
     test_anatomical_mappings()
+    test_laterality_flags()
+    test_find_anatomical_terms()
@@ -0,0 +1,113 @@
+"""
+Tests for Data Transformer
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data_transformer import (
+    quantize_embeddings_int8,
+    convert_to_dashboard_format,
+    load_embedding_cache
+)
+
+
+class _FakeParameter:
+    def __init__(self, dtype):
+        self.dtype = dtype
+
+
+class _FakeEncoder:
+    """Stand-in for a SentenceTransformer that counts encoded texts"""
+
+    max_seq_length = 384
+
+    def __init__(self, dtype="torch.float32"):
+        self.dtype = dtype
+        self.encoded = 0
+
+    def parameters(self):
+        return iter([_FakeParameter(self.dtype)])
+
+    def get_sentence_embedding_dimension(self):
+        return 3
+
+    def encode(self, texts, **kwargs):
+        self.encoded += len(texts)
+        return np.ones((len(texts), 3), dtype=np.float32)
+
+
+def test_quantize_embeddings_int8():
+    """Test that int8 embeddings keep cosine similarity close to float32"""
+    print("=" * 70)
+    print("Data Transformer - Test Suite")
+    print("=" * 70)
+    print()
+
+    rng = np.random.default_rng(0)
+    embeddings = rng.normal(size=(200, 384)).astype(np.float32)
+    embeddings[0] = 0.0  # Zero rows must not divide by zero
+
+    quantized = quantize_embeddings_int8(embeddings)
+    assert quantized.dtype == np.int8
+    assert quantized.shape == embeddings.shape
+    assert not quantized[0].any()
+
+    # Readers cast to float32 and renormalize before cosine search
+    def normalize(matrix):
+        matrix = matrix.astype(np.float32)
+        return matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+
+    original = normalize(embeddings[1:])
+    restored = normalize(quantized[1:])
+    query = original[:10]
+
+    cosine_error = np.abs(query @ original.T - query @ restored.T).max()
+    print(f"Max cosine similarity error: {cosine_error:.4f}")
+    assert cosine_error < 0.02
+
+    print("✅ Int8 quantization test passed")
+
+
+def test_embedding_cache_keys():
+    """Test that the embedding cache is keyed by encoder settings and pruned on save"""
+    print("Testing embedding cache keys...")
+
+    cases = [
+        {'case_name': f'Plaintiff{i} v. Defendant', 'year': 2010, 'comments': f'Comment {i}', 'injuries': ['whiplash']}
+        for i in range(3)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_path = Path(tmp_dir) / "embeddings_cache.pkl"
+
+        def encoded_count(cases, max_seq_length=128, dtype="torch.float32"):
+            model = _FakeEncoder(dtype)
+            convert_to_dashboard_format(cases, model, cache_path=cache_path, max_seq_length=max_seq_length)
+            return model.encoded
+
+        assert encoded_count(cases) == 3
+        assert encoded_count(cases) == 0  # Same settings: all cached
+        assert encoded_count(cases, max_seq_length=64) == 3
+        assert encoded_count(cases, max_seq_length=64, dtype="torch.float16") == 3
+
+        # Only the entries used by the last run are kept
+        assert encoded_count(cases[:2], max_seq_length=64, dtype="torch.float16") == 0
+        assert len(load_embedding_cache(cache_path)) == 2
+
+    # Shared embeddings are immutable, so editing one case can't change another
+    dashboard_cases = convert_to_dashboard_format(cases, _FakeEncoder())
+    assert all(isinstance(case['embedding'], tuple) for case in dashboard_cases)
+
+    print("✅ Embedding cache key test passed")
+
+
+if __name__ == "__main__":
+    test_quantize_embeddings_int8()
+    test_embedding_cache_keys()
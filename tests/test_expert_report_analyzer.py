@@ -4,12 +4,14 @@ Tests for Expert Report Analyzer
 
 import sys
 import json
+import tempfile
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from expert_report_analyzer import analyze_expert_report
+import expert_report_analyzer
+from expert_report_analyzer import analyze_expert_report, ExpertReportAnalyzer, LLMResultCache
 
 
 def test_expert_report_analysis():
@@ -42,5 +44,86 @@ def test_expert_report_analysis():
     print("\n✅ Expert report analysis test completed")
 
 
+def test_llm_result_cache():
+    """Test the SQLite LLM cache round trip and the no-cache fallback"""
+    print("Testing LLM result cache...")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_path = str(Path(tmp_dir) / "cache.sqlite")
+        key = LLMResultCache.make_key("openai", "model-a", "prompt")
+        assert key != LLMResultCache.make_key("openai", "model-b", "prompt")
+
+        cache = LLMResultCache(cache_path)
+        assert cache.get(key) is None
+        cache.set(key, {"injuries": ["fractured femur"], "severity": "severe"})
+
+        # A second connection to the same file sees the stored analysis
+        reopened = LLMResultCache(cache_path)
+        assert reopened.get(key) == {"injuries": ["fractured femur"], "severity": "severe"}
+
+    # Caching is off by default and an unopenable path is not fatal
+    assert ExpertReportAnalyzer()._get_cache() is None
+    analyzer = ExpertReportAnalyzer(cache_path="/nonexistent/dir/cache.sqlite")
+    assert analyzer._get_cache() is None
+    assert analyzer.cache_path is None
+
+    print("✅ LLM result cache test passed")
+
+
+def test_parse_llm_json():
+    """Test parsing model answers with and without markdown fences"""
+    print("Testing LLM JSON parsing...")
+
+    expected = {"injuries": ["whiplash"], "severity": "mild"}
+    answers = [
+        '{"injuries": ["whiplash"], "severity": "mild"}',
+        'Here you go:\n```json\n{"injuries": ["whiplash"], "severity": "mild"}\n```\nDone.',
+        '```\n{"injuries": ["whiplash"], "severity": "mild"}\n```',
+    ]
+    for answer in answers:
+        assert ExpertReportAnalyzer._parse_llm_json(answer) == expected
+
+    print("✅ LLM JSON parsing test passed")
+
+
+def test_regex_fallback():
+    """Test regex extraction, including overlapping sequelae, with and without Hyperscan"""
+    print("Testing regex fallback extraction...")
+
+    text = (
+        "MRI shows a C5-C6 disc herniation. The fall causes pain with walking up stairs "
+        "and sitting. Severe chronic lower back pain persists."
+    )
+    analyzer = ExpertReportAnalyzer()
+    result = analyzer._analyze_with_regex(text)
+    print(json.dumps(result, indent=2))
+
+    assert "mri shows a c5-c6 disc herniation" in result["injuries"]
+    # The limitation nested inside the "causes ..." capture must still be found
+    assert sorted(result["sequelae"]) == sorted([
+        "the fall causes pain",
+        "pain with walking up stairs and sitting",
+        "walking up stairs and sitting",
+        "severe chronic lower back pain",
+    ])
+    assert result["severity"] == "severe"
+
+    # The Hyperscan prefilter only skips patterns; results must not change without it
+    hyperscan_db = expert_report_analyzer._HYPERSCAN_DB
+    expert_report_analyzer._HYPERSCAN_DB = None
+    try:
+        plain = analyzer._analyze_with_regex(text)
+    finally:
+        expert_report_analyzer._HYPERSCAN_DB = hyperscan_db
+    assert sorted(plain["injuries"]) == sorted(result["injuries"])
+    assert sorted(plain["sequelae"]) == sorted(result["sequelae"])
+    assert plain["severity"] == result["severity"]
+
+    print("✅ Regex fallback test passed")
+
+
 if __name__ == "__main__":
     test_expert_report_analysis()
+    test_llm_result_cache()
+    test_parse_llm_json()
+    test_regex_fallback()
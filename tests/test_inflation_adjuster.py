@@ -2,14 +2,20 @@
 Tests for Inflation Adjuster
 """
 
+import os
 import sys
+import tempfile
 from pathlib import Path
 
+import numpy as np
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from inflation_adjuster import (
     adjust_for_inflation,
+    adjust_for_inflation_batch,
+    load_boc_cpi_data,
     get_inflation_rate,
     format_inflation_info,
     get_data_source,
@@ -68,5 +74,54 @@ def test_inflation_adjustment():
     print("✅ All inflation tests passed")
 
 
+def test_cpi_sidecar_reload():
+    """Test that parsed CPI averages are reused until the CSV changes"""
+    print("Testing CPI sidecar cache...")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = Path(tmp_dir) / "boc_cpi.csv"
+        csv_path.write_text("date,V41690973\n2021-01,100.0\n2021-02,102.0\n2022-01,110.0R\n")
+
+        parsed = load_boc_cpi_data(csv_path)
+        assert parsed == {2021: 101.0, 2022: 110.0}
+        assert csv_path.with_suffix('.npz').exists()
+
+        # Reloading reads the sidecar and gives the same averages
+        assert load_boc_cpi_data(csv_path) == parsed
+
+        # A newer CSV makes the sidecar stale, so the CSV is parsed again
+        csv_path.write_text("date,V41690973\n2021-01,120.0\n")
+        sidecar_mtime = csv_path.with_suffix('.npz').stat().st_mtime
+        os.utime(csv_path, (sidecar_mtime + 10, sidecar_mtime + 10))
+        assert load_boc_cpi_data(csv_path) == {2021: 120.0}
+
+    print("✅ CPI sidecar cache test passed")
+
+
+def test_inflation_batch_matches_scalar():
+    """Test that batch adjustment agrees with adjust_for_inflation per amount"""
+    print("Testing batch inflation adjustment...")
+
+    amounts = [75000, 95000, 125000, 85000, 50000]
+    years = [2010, 2015, 2020, 2023, 1800]
+    batch = adjust_for_inflation_batch(amounts, years, 2024)
+
+    for amount, year, adjusted in zip(amounts, years, batch):
+        expected = adjust_for_inflation(amount, year, 2024)
+        if expected is None:
+            assert np.isnan(adjusted)
+        else:
+            assert adjusted == expected, (amount, year, adjusted, expected)
+
+    # Bad years only affect their own row
+    mixed = adjust_for_inflation_batch([100, 100, 100, 100], [2010, "unknown", None, float("nan")], 2024)
+    assert mixed[0] == adjust_for_inflation(100, 2010, 2024)
+    assert np.isnan(mixed[1:]).all()
+
+    print("✅ Batch inflation adjustment test passed")
+
+
 if __name__ == "__main__":
     test_inflation_adjustment()
+    test_cpi_sidecar_reload()
+    test_inflation_batch_matches_scalar()